@@ -0,0 +1,245 @@
+import json
+import logging
+from job_scraper import JobScraper
+from job_cleaner import DedupIndex, is_complete, normalize_job
+from job_categorizer import JobCategorizer
+from job_history import PostingHistory, posting_fingerprint, posting_key
+from job_index import JobIndex
+from job_agent import JobSearchAgent, start_scheduler
+from notifier import NotificationDispatcher
+from run_log import RunLog, RunTimer
+
+
+class AgentHost:
+    """
+    Runs the job search for many users in one process.
+
+    Each interval, every distinct (site config, query) pair across users is
+    scraped once through a single JobScraper (one session, one Chrome
+    pool), and the merged postings are history-filtered, cleaned and
+    categorized once. Ranking, resume enhancement and notification then
+    fan out per user through a JobSearchAgent that holds that user's
+    profile, filters and notification settings.
+
+    users: list of dicts with
+      - profile: user profile (as for JobSearchAgent); profile['query'] is
+        the user's search query
+      - notify_cfg: notification settings
+      - name (optional): label used in logs and the run log
+      - site_configs (optional): boards for this user; defaults to the
+        host's site_configs
+
+    Notifications for all users go through one NotificationDispatcher, so
+    they are delivered in the background over shared SMTP connections and
+    HTTP session; the 'notify' stage times only queueing and the 'deliver'
+    stage waits for the queue to drain. Users with no matching jobs get no
+    notification. Postings are recorded in the history only when every
+    notification of the run was delivered.
+
+    Postings are deduplicated across all users' boards: when two boards
+    carry near-duplicates of one posting, only the first copy is kept, and
+    it is offered to every user whose boards returned any of the copies.
+    """
+
+    def __init__(self, users, site_configs, history_path=None, scrape_cache_dir=None,
+                 index_path=None, run_log_path=None, top_n=5, enhance_seed=None,
+                 dispatcher=None):
+        self.site_configs = site_configs
+        # A dispatcher passed in is left for its owner to close
+        self._owns_dispatcher = dispatcher is None
+        self.dispatcher = dispatcher or NotificationDispatcher()
+        self.users = []
+        for i, user in enumerate(users):
+            configs = user.get('site_configs', site_configs)
+            # Sites are scraped by the host; the agent keeps the user's filters
+            agent = JobSearchAgent(user['profile'], [], user['notify_cfg'], top_n=top_n,
+                                   enhance_seed=enhance_seed, dispatcher=self.dispatcher)
+            self.users.append({'name': user.get('name', f'user{i}'), 'agent': agent,
+                               'site_configs': configs})
+        all_configs = self._distinct_configs(u['site_configs'] for u in self.users)
+        self.scraper = JobScraper(all_configs, cache_dir=scrape_cache_dir)
+        self.categorizer = JobCategorizer()
+        self.history = PostingHistory(history_path) if history_path else None
+        self.index_path = index_path
+        self.index = JobIndex.load(index_path) if index_path else None
+        self.run_log = RunLog(run_log_path) if run_log_path else None
+
+    @staticmethod
+    def _config_key(config) -> str:
+        return json.dumps(config, sort_keys=True, default=str)
+
+    def _distinct_configs(self, config_lists) -> list:
+        seen = {}
+        for configs in config_lists:
+            for config in configs:
+                seen.setdefault(self._config_key(config), config)
+        return list(seen.values())
+
+    def _scrape_requests(self):
+        # Distinct (config, query) pairs and, per user, the pair keys they need
+        pairs = {}
+        user_pairs = []
+        for user in self.users:
+            query = user['agent'].profile.get('query')
+            keys = set()
+            for config in user['site_configs']:
+                key = (self._config_key(config), query)
+                pairs.setdefault(key, (config, query))
+                keys.add(key)
+            user_pairs.append(keys)
+        return pairs, user_pairs
+
+    def run(self) -> dict:
+        """
+        One interval for every user. Returns the run summary, which is also
+        appended to the run log.
+        """
+        timer = RunTimer()
+        try:
+            self._run(timer)
+        except Exception as e:
+            self._log_run(timer.summary('error', error=repr(e), users=len(self.users)))
+            raise
+        summary = timer.summary(users=len(self.users))
+        self._log_run(summary)
+        return summary
+
+    def _log_run(self, summary):
+        logging.info(f"Host run {summary['status']} for {len(self.users)} users "
+                     f"in {summary['wall_s']:.2f}s")
+        if self.run_log is not None:
+            self.run_log.write(summary)
+
+    def _run(self, timer):
+        pairs, user_pairs = self._scrape_requests()
+        keys = list(pairs)
+
+        logging.info(f'Scraping {len(keys)} distinct board/query pairs...')
+        with timer.stage('scrape', pairs=len(keys)) as stage:
+            results = self.scraper.scrape_many([pairs[k] for k in keys])
+            stage['items'] = sum(len(jobs) for jobs in results)
+
+        # Fingerprints each pair returned, and the merged raw postings
+        pair_fingerprints = {}
+        raw_jobs = []
+        for key, jobs in zip(keys, results):
+            fingerprints = pair_fingerprints.setdefault(key, set())
+            for job in jobs:
+                fp = posting_fingerprint(job)
+                fingerprints.add(fp)
+                raw_jobs.append((fp, job))
+
+        if self.history is not None:
+            with timer.stage('history') as stage:
+                new = self.history.filter_new([job for _, job in raw_jobs])
+                new_ids = {id(job) for job in new}
+                raw_jobs = [(fp, job) for fp, job in raw_jobs if id(job) in new_ids]
+                stage['items'] = len(raw_jobs)
+
+        with timer.stage('clean') as stage:
+            # (fingerprints, job): a kept posting with the fingerprints of
+            # itself and every duplicate dropped in its favour
+            corpus = []
+            # Dedup slot -> fingerprints; slots number kept postings in order
+            slot_fingerprints = []
+            dedup = DedupIndex()
+            for fp, job in raw_jobs:
+                if not is_complete(job):
+                    continue
+                norm_job = normalize_job(job)
+                if dedup.add(norm_job):
+                    slot_fingerprints.append({fp})
+                    corpus.append((slot_fingerprints[-1], norm_job))
+                else:
+                    slot_fingerprints[dedup.last_match].add(fp)
+            stage['items'] = len(corpus)
+        logging.info(f'{len(corpus)} jobs after cleaning')
+
+        with timer.stage('categorize', items=len(corpus)):
+            all_tags = self.categorizer.categorize_many([job.get('description', '')
+                                                         for _, job in corpus])
+            for (_, job), tags in zip(corpus, all_tags):
+                job.update(tags)
+            if self.index is not None:
+                self.index.add_many(job for _, job in corpus)
+
+        all_pairs = set(keys)
+        failed = self.dispatcher.failed
+        delivered = True
+        for user, needed in zip(self.users, user_pairs):
+            if not self._serve_user(user, corpus, needed, all_pairs, pair_fingerprints, timer):
+                delivered = False
+        with timer.stage('deliver'):
+            self.dispatcher.flush()
+        delivered = delivered and self.dispatcher.failed == failed
+
+        # The history is shared, so postings are only recorded once every
+        # user's notifications went out; otherwise all are offered again
+        if self.history is not None and delivered:
+            self.history.mark_keys_seen([posting_key(job) for _, job in raw_jobs])
+        elif not delivered:
+            logging.warning('Some notifications failed; postings stay unseen for the next run')
+        if self.index is not None:
+            self.index.save(self.index_path)
+
+    def _serve_user(self, user, corpus, needed, all_pairs, pair_fingerprints, timer):
+        agent = user['agent']
+        name = user['name']
+        if needed == all_pairs:
+            jobs = [job for _, job in corpus]
+        else:
+            visible = set().union(*(pair_fingerprints[k] for k in needed))
+            jobs = [job for fps, job in corpus if not fps.isdisjoint(visible)]
+        # The user's remote/full-time/salary filters (the agent's scraper has no sites)
+        jobs = agent.scraper.filter_jobs(jobs)
+
+        with timer.stage('rank', items=len(jobs), user=name):
+            ranked = agent.ranker.rank_jobs(jobs, agent.profile, top_n=agent.top_n)
+        with timer.stage('enhance', items=len(ranked), user=name):
+            enhanced_resumes = agent.enhance(ranked)
+        payload = {
+            'timestamp': timer.started,
+            'ranked_jobs': ranked,
+            'enhanced_resumes': enhanced_resumes
+        }
+        if not ranked:
+            logging.info(f'No matching jobs for {name}; skipping notification')
+            return True
+        with timer.stage('notify', items=len(ranked), user=name):
+            try:
+                agent.notify(payload)
+            except Exception:
+                # One user's failing channel must not block the others
+                logging.exception(f'Notification failed for {name}')
+                return False
+        return True
+
+    def close(self):
+        self.scraper.close()
+        if self._owns_dispatcher:
+            self.dispatcher.close()
+        if self.history is not None:
+            self.history.close()
+
+
+def schedule_host(users, site_configs, interval_minutes=60, history_path=None,
+                  scrape_cache_dir=None, index_path=None, run_log_path=None, background=False):
+    """
+    Run an AgentHost for all users every interval_minutes (see schedule_agent).
+    """
+    host = AgentHost(users, site_configs, history_path=history_path,
+                     scrape_cache_dir=scrape_cache_dir, index_path=index_path,
+                     run_log_path=run_log_path)
+    return start_scheduler(host.run, interval_minutes, background)
+
+
+if __name__ == '__main__':
+    # users.json: [{"name": ..., "profile": {...}, "notify_cfg": {...}}, ...]
+    with open('users.json') as f:
+        users = json.load(f)
+    with open('site_configs.json') as f:
+        site_configs = json.load(f)
+
+    schedule_host(users, site_configs, interval_minutes=120,
+                  history_path='job_history.db', scrape_cache_dir='.scrape_cache',
+                  run_log_path='agent_runs.jsonl')
@@ -0,0 +1,410 @@
+# benchmarks.py
+"""
+Micro-benchmarks for the job pipeline modules.
+
+Usage:
+    python benchmarks.py dedup --sizes 1000 10000 100000
+    python benchmarks.py dedup --single-block --sizes 1000 3000 10000
+    python benchmarks.py rank --sizes 10000 100000
+    python benchmarks.py rank-many --jobs 10000 --profiles 1 10 100
+    python benchmarks.py categorize --jobs 2000 --words 400
+    python benchmarks.py categorize-many --jobs 100000 --workers 1 2 4
+    python benchmarks.py importtime --modules example job_agent
+    python benchmarks.py sentiment --jobs 2000 --words 200
+    python benchmarks.py flag --resumes 2000 --bullets 30
+"""
+import argparse
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from job_cleaner import deduplicate_jobs, deduplicate_jobs_naive
+from job_ranker import JobRanker, JobMatrix
+from job_categorizer import JobCategorizer
+from job_matcher import SENTIMENT_BACKENDS
+from resume_flagger import VAGUE_PATTERNS, flag_many, flag_vague_bullets_naive
+
+SENIORITY = ['Junior', 'Senior', 'Staff', 'Principal', 'Lead', '']
+ROLES = ['Software Engineer', 'Data Scientist', 'Backend Developer', 'Frontend Developer',
+         'DevOps Engineer', 'Product Manager', 'Data Analyst', 'ML Engineer',
+         'Site Reliability Engineer', 'Engineering Manager', 'UX Designer']
+TEAMS = ['Platform', 'Payments', 'Growth', 'Search', 'Infrastructure', 'Mobile', 'Analytics']
+LOCATIONS = ['Remote', 'New York', 'San Francisco', 'Austin', 'Seattle', 'Boston',
+             'London', 'Berlin', 'Toronto', 'Chicago']
+
+
+def synthetic_jobs(n: int, seed: int = 0, single_block: bool = False) -> list:
+    """
+    Build n postings where roughly a third are near-duplicate reposts
+    (case, whitespace or small title edits) of an earlier posting.
+    With single_block every posting shares one company and location, the
+    worst case for blocking.
+    """
+    rng = random.Random(seed)
+    companies = [f'Company {i}' for i in range(max(n // 20, 10))]
+    locations = LOCATIONS[:1] if single_block else LOCATIONS
+    if single_block:
+        companies = companies[:1]
+    jobs = []
+    for i in range(n):
+        if jobs and rng.random() < 0.33:
+            job = dict(rng.choice(jobs))
+            title = job['title']
+            edit = rng.randrange(3)
+            if edit == 0:
+                title = title.lower()
+            elif edit == 1:
+                title = title + ' (Remote)'
+            else:
+                title = title.replace(' ', '  ', 1)
+            job['title'] = title
+            job['company'] = job['company'].upper() if rng.random() < 0.5 else job['company']
+        else:
+            title = ' '.join(p for p in (rng.choice(SENIORITY), rng.choice(ROLES),
+                                         rng.choice(TEAMS)) if p)
+            job = {'title': title,
+                   'company': rng.choice(companies),
+                   'location': rng.choice(locations),
+                   'description': '...',
+                   'apply_link': f'http://example.com/jobs/{i}'}
+        jobs.append(job)
+    return jobs
+
+
+SKILLS = ['python', 'java', 'go', 'rust', 'sql', 'aws', 'gcp', 'docker', 'kubernetes',
+          'react', 'typescript', 'spark', 'pandas', 'pytorch', 'terraform', 'airflow']
+MISSIONS = ['sustainability', 'open source', 'healthcare', 'education', 'fintech', 'climate']
+
+
+def synthetic_ranker_jobs(n: int, seed: int = 0) -> list:
+    """
+    Build n categorized jobs in the shape JobRanker expects.
+    """
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        low = rng.randrange(60, 200) * 1000
+        jobs.append({
+            'id': i,
+            'skills': set(rng.sample(SKILLS, rng.randrange(1, 6))),
+            'mission_keywords': rng.sample(MISSIONS, rng.randrange(0, 3)),
+            'salary_range': (low, low + rng.randrange(0, 60) * 1000),
+            'work_location': rng.choice(['remote', 'on_site', 'unspecified']),
+            'company_size': rng.choice(['startup', 'mid', 'enterprise']),
+            'growth_potential': rng.random(),
+        })
+    return jobs
+
+
+def synthetic_profile(seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    return {
+        'desired_skills': set(rng.sample(SKILLS, 4)),
+        'mission_keywords': rng.sample(MISSIONS, 2),
+        'desired_salary': rng.randrange(80, 180) * 1000,
+        'location_preference': rng.choice(['remote', 'on_site', 'either']),
+        'preferred_company_size': rng.sample(['startup', 'mid', 'enterprise'], 2),
+    }
+
+
+FILLER = ('we are looking for a teammate to join our group and help build reliable systems '
+          'you will collaborate with stakeholders across the company on ambitious goals '
+          'competitive benefits include health dental vision equity and generous leave').split()
+CATEGORY_TERMS = ['python', 'react', 'remote', 'manager', 'engineer', 'finance', 'docker',
+                  'healthcare', 'on-site', 'data science', 'kubernetes', 'lead', 'in office',
+                  'machine learning', 'retail', 'designer', 'ci/cd', 'analyst', 'school']
+
+
+def synthetic_descriptions(n: int, words: int, seed: int = 0) -> list:
+    """
+    Build n job descriptions of about `words` words, ~3% category keywords.
+    """
+    rng = random.Random(seed)
+    return [' '.join(rng.choice(CATEGORY_TERMS).title() if rng.random() < 0.03
+                     else rng.choice(FILLER) for _ in range(words))
+            for _ in range(n)]
+
+
+# Job-ad sentences for the sentiment benchmark: plain statements, praise,
+# honest downsides, and phrasings with negation and intensifiers, which
+# TextBlob handles and the lexicon backend does not
+AD_SENTENCES = [
+    'We are looking for a backend engineer to join our payments team.',
+    'You will design, build and operate services used by millions of customers.',
+    'The role reports to the director of engineering and is based in Austin.',
+    'Benefits include health, dental and vision coverage and a 401k match.',
+    'Experience with Python, SQL and cloud infrastructure is required.',
+    'We offer a very competitive salary and excellent benefits.',
+    'Our team is friendly, supportive and extremely collaborative.',
+    'Join an innovative, passionate group working on genuinely interesting problems.',
+    'You will have the freedom to pick the best tools for the job.',
+    'This is an amazing opportunity to grow into a leadership role.',
+    'We are a small but really ambitious startup with a clear mission.',
+    'The pace is fast and the hours can be long during launches.',
+    'The legacy codebase is old and poorly documented.',
+    'Deadlines are tight and priorities change often.',
+    'On-call duty is required one week in four.',
+    'The commute to the office can be difficult in winter.',
+    'This is not a boring maintenance role.',
+    'You will not be micromanaged.',
+    'No prior experience with Kubernetes is necessary.',
+    'The work is never dull, although it is not always easy.',
+    'Candidates who are not comfortable with ambiguity may struggle here.',
+    'Our processes are not perfect, and we are not afraid to say so.',
+    'The salary is not the highest in the market, but the equity is generous.',
+    'This position is extremely demanding and not suited to everyone.',
+    'Applicants describe our interviews as hard but very fair.',
+    'We are really proud of our quiet, focused and respectful culture.',
+]
+
+
+def synthetic_toned_descriptions(n: int, words: int, seed: int = 0) -> list:
+    """
+    Build n job ads of about `words` words from AD_SENTENCES, each ad
+    leaning positive, negative or mixed.
+    """
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        # Per-ad weights so documents differ in overall tone
+        weights = [rng.random() ** 2 for _ in AD_SENTENCES]
+        sentences = []
+        count = 0
+        while count < words:
+            sentence = rng.choices(AD_SENTENCES, weights)[0]
+            sentences.append(sentence)
+            count += len(sentence.split())
+        texts.append(' '.join(sentences))
+    return texts
+
+
+BULLET_WORDS = ('built migrated designed shipped automated reduced improved the a service '
+                'pipeline latency cost team customers by using across with for').split()
+VAGUE_PHRASES = ['led many projects', 'responsible for', 'team player', 'detail-oriented',
+                 'involved in', 'passionate about', 'handled', 'results driven']
+
+
+def synthetic_resumes(n: int, bullets: int, seed: int = 0) -> list:
+    """
+    Build n resumes of `bullets` '-' lines, about a quarter containing a vague phrase.
+    """
+    rng = random.Random(seed)
+    resumes = []
+    for _ in range(n):
+        lines = ['Jane Doe', 'Experience']
+        for _ in range(bullets):
+            words = [rng.choice(BULLET_WORDS) for _ in range(rng.randrange(6, 16))]
+            if rng.random() < 0.25:
+                words.insert(rng.randrange(len(words)), rng.choice(VAGUE_PHRASES))
+            lines.append('- ' + ' '.join(words).capitalize() + '.')
+        resumes.append('\n'.join(lines))
+    return resumes
+
+
+def _pearson(xs: list, ys: list) -> float:
+    mx, my = statistics.fmean(xs), statistics.fmean(ys)
+    cov = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    var = (sum((x - mx) ** 2 for x in xs) * sum((y - my) ** 2 for y in ys)) ** 0.5
+    return cov / var if var else float('nan')
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_dedup(args):
+    print(f"{'postings':>10} {'kept':>8} {'indexed (s)':>12} {'naive (s)':>10}")
+    for n in args.sizes:
+        jobs = synthetic_jobs(n, single_block=args.single_block)
+        fast, fast_s = _timed(deduplicate_jobs, jobs)
+        naive_s = '-'
+        if n <= args.naive_max:
+            naive, elapsed = _timed(deduplicate_jobs_naive, jobs)
+            if naive != fast:
+                raise AssertionError(f'indexed and naive dedup disagree at n={n}')
+            naive_s = f'{elapsed:.3f}'
+        print(f'{n:>10} {len(fast):>8} {fast_s:>12.3f} {naive_s:>10}')
+
+
+def bench_rank(args):
+    ranker = JobRanker()
+    profile = synthetic_profile()
+    print(f"{'jobs':>10} {'scalar (s)':>11} {'encode (s)':>11} {'batch (s)':>10}")
+    for n in args.sizes:
+        jobs = synthetic_ranker_jobs(n)
+        scalar, scalar_s = _timed(ranker.rank_jobs, jobs, profile, args.top_n)
+        matrix, encode_s = _timed(JobMatrix, jobs)
+        batch, batch_s = _timed(ranker.rank_batch, matrix, profile, args.top_n)
+        if batch != scalar:
+            raise AssertionError(f'batch and scalar ranking disagree at n={n}')
+        print(f'{n:>10} {scalar_s:>11.3f} {encode_s:>11.3f} {batch_s:>10.3f}')
+
+
+def bench_rank_many(args):
+    ranker = JobRanker()
+    jobs = synthetic_ranker_jobs(args.jobs)
+    matrix, encode_s = _timed(JobMatrix, jobs)
+    print(f'{args.jobs} jobs, encoded once in {encode_s:.3f}s')
+    print(f"{'profiles':>10} {'per-profile (s)':>16} {'matrix (s)':>11}")
+    for p in args.profiles:
+        profiles = [synthetic_profile(seed) for seed in range(p)]
+        looped, looped_s = _timed(lambda: [ranker.rank_jobs(jobs, prof, args.top_n)
+                                           for prof in profiles])
+        many, many_s = _timed(ranker.rank_many, matrix, profiles, args.top_n)
+        if many != looped:
+            raise AssertionError(f'rank_many disagrees with rank_jobs for {p} profiles')
+        print(f'{p:>10} {looped_s:>16.3f} {many_s:>11.3f}')
+
+
+def bench_categorize(args):
+    categorizer = JobCategorizer()
+    texts = synthetic_descriptions(args.jobs, args.words)
+    indexed, indexed_s = _timed(lambda: [categorizer.categorize(t) for t in texts])
+    naive, naive_s = _timed(lambda: [categorizer.categorize_naive(t) for t in texts])
+    if indexed != naive:
+        raise AssertionError('indexed and naive categorization disagree')
+    per_job = lambda s: s / len(texts) * 1e6
+    print(f'{args.jobs} descriptions x {args.words} words')
+    print(f'naive:   {per_job(naive_s):8.1f} us/job')
+    print(f'indexed: {per_job(indexed_s):8.1f} us/job ({naive_s / indexed_s:.1f}x)')
+
+
+def bench_categorize_many(args):
+    categorizer = JobCategorizer()
+    texts = synthetic_descriptions(args.jobs, args.words)
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>8} {'jobs/s':>10}")
+    for workers in args.workers:
+        tags, elapsed = _timed(categorizer.categorize_many, texts, workers)
+        if baseline is None:
+            baseline = tags
+        elif tags != baseline:
+            raise AssertionError(f'categorize_many results differ with {workers} workers')
+        print(f'{workers:>8} {elapsed:>8.2f} {len(texts) / elapsed:>10.0f}')
+
+
+def _import_profile(module: str) -> tuple:
+    """
+    Import module in a fresh interpreter under -X importtime.
+    Returns (cumulative microseconds for module, {name: self microseconds}).
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          capture_output=True, text=True, check=True)
+    cumulative = None
+    self_times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cum_us, name = line[len('import time:'):].split('|')
+        self_times[name.strip()] = int(self_us)
+        if name.strip() == module:
+            cumulative = int(cum_us)
+    return cumulative, self_times
+
+
+def bench_importtime(args):
+    print(f"{'module':>14} {'median (ms)':>12} {'min (ms)':>9}  heaviest imports")
+    for module in args.modules:
+        runs = [_import_profile(module) for _ in range(args.runs)]
+        totals = [cum / 1000 for cum, _ in runs]
+        heaviest = sorted(runs[-1][1].items(), key=lambda kv: kv[1], reverse=True)[:3]
+        detail = ', '.join(f'{name} {us / 1000:.1f}' for name, us in heaviest)
+        print(f'{module:>14} {statistics.median(totals):>12.1f} {min(totals):>9.1f}  {detail}')
+
+
+def bench_sentiment(args):
+    texts = synthetic_toned_descriptions(args.jobs, args.words)
+    results = {}
+    print(f"{'backend':>10} {'docs/s':>10} {'MAE':>7} {'pearson':>8} {'sign agree':>11}")
+    for name in args.backends:
+        backend = SENTIMENT_BACKENDS[name]()
+        scores, elapsed = _timed(lambda: [backend.polarity(t) for t in texts])
+        results[name] = scores
+        reference = results.get(args.reference)
+        if reference is None:
+            accuracy = f"{'-':>7} {'-':>8} {'-':>11}"
+        else:
+            mae = statistics.fmean(abs(a - b) for a, b in zip(scores, reference))
+            agree = sum((a > 0) - (a < 0) == (b > 0) - (b < 0)
+                        for a, b in zip(scores, reference)) / len(texts)
+            accuracy = f'{mae:>7.3f} {_pearson(scores, reference):>8.3f} {agree:>10.1%}'
+        print(f'{name:>10} {len(texts) / elapsed:>10.0f} {accuracy}')
+
+
+def bench_flag(args):
+    resumes = synthetic_resumes(args.resumes, args.bullets)
+    naive, naive_s = _timed(lambda: [flag_vague_bullets_naive(r) for r in resumes])
+    print(f'{args.resumes} resumes x {args.bullets} bullets, {len(VAGUE_PATTERNS)} patterns')
+    print(f"{'engine':>10} {'resumes/s':>10}")
+    print(f"{'naive':>10} {len(resumes) / naive_s:>10.0f}")
+    for workers in args.workers:
+        flagged, elapsed = _timed(flag_many, resumes, workers)
+        if flagged != naive:
+            raise AssertionError(f'flag_many disagrees with the naive flagger ({workers} workers)')
+        print(f"{f'indexed/{workers}':>10} {len(resumes) / elapsed:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run job pipeline micro-benchmarks.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    dedup = sub.add_parser('dedup', help="Indexed vs naive near-duplicate detection.")
+    dedup.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    dedup.add_argument('--naive-max', type=int, default=1000,
+                       help="Largest size to also run (and cross-check) the O(n^2) reference on.")
+    dedup.add_argument('--single-block', action='store_true',
+                       help="Put every posting under one company and location.")
+    dedup.set_defaults(func=bench_dedup)
+
+    rank = sub.add_parser('rank', help="Scalar vs NumPy batch ranking of one profile.")
+    rank.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    rank.add_argument('--top-n', type=int, default=50)
+    rank.set_defaults(func=bench_rank)
+
+    rank_many = sub.add_parser('rank-many', help="Per-profile vs jobs x profiles matrix ranking.")
+    rank_many.add_argument('--jobs', type=int, default=10000)
+    rank_many.add_argument('--profiles', type=int, nargs='+', default=[1, 10, 100])
+    rank_many.add_argument('--top-n', type=int, default=50)
+    rank_many.set_defaults(func=bench_rank_many)
+
+    categorize = sub.add_parser('categorize', help="Per-pattern vs indexed categorization.")
+    categorize.add_argument('--jobs', type=int, default=2000)
+    categorize.add_argument('--words', type=int, default=400)
+    categorize.set_defaults(func=bench_categorize)
+
+    categorize_many = sub.add_parser('categorize-many', help="categorize_many throughput by worker count.")
+    categorize_many.add_argument('--jobs', type=int, default=100000)
+    categorize_many.add_argument('--words', type=int, default=400)
+    categorize_many.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    categorize_many.set_defaults(func=bench_categorize_many)
+
+    importtime = sub.add_parser('importtime', help="Cold-start import latency (python -X importtime).")
+    importtime.add_argument('--modules', nargs='+', default=['example', 'job_agent'])
+    importtime.add_argument('--runs', type=int, default=5)
+    importtime.set_defaults(func=bench_importtime)
+
+    sentiment = sub.add_parser('sentiment', help="Sentiment backend throughput and accuracy vs a reference.")
+    sentiment.add_argument('--jobs', type=int, default=2000)
+    sentiment.add_argument('--words', type=int, default=200)
+    sentiment.add_argument('--backends', nargs='+', default=['textblob', 'lexicon'],
+                           choices=sorted(SENTIMENT_BACKENDS),
+                           help="Backends to run; accuracy is reported once the reference has run.")
+    sentiment.add_argument('--reference', default='textblob')
+    sentiment.set_defaults(func=bench_sentiment)
+
+    flag = sub.add_parser('flag', help="Per-bullet vs single-scan resume flagging.")
+    flag.add_argument('--resumes', type=int, default=2000)
+    flag.add_argument('--bullets', type=int, default=30)
+    flag.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    flag.set_defaults(func=bench_flag)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
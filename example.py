@@ -1,29 +1,105 @@
 # example.py
 """
 A quick command-line runner for the job_matcher module.
+
+Single job:
+    python example.py --job job.txt --profile profile.json
+
+Batch (directory of .txt files, or JSONL with "id" and "description"):
+    python example.py --jobs jobs.jsonl --profile profile.json --top 20 --workers 4
 """
+import heapq
 import json
+import os
+import sys
+import time
 import argparse
-from job_matcher import match_score
+from job_matcher import SENTIMENT_BACKENDS, match_score, match_scores, set_sentiment_backend
+
+
+def load_jobs(path):
+    """
+    Yield (job_id, description) pairs from a directory of .txt files
+    (id = file name) or a JSONL file (id = "id" field or line number).
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith('.txt'):
+                with open(os.path.join(path, name), 'r', encoding='utf-8') as f:
+                    yield name, f.read()
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield record.get('id', lineno), record.get('description', record.get('text', ''))
+
+
+def run_batch(args, profile_json):
+    start = time.perf_counter()
+    scored = 0
+
+    def counted(results):
+        nonlocal scored
+        for item in results:
+            scored += 1
+            yield item
+
+    results = counted(match_scores(load_jobs(args.jobs), profile_json, workers=args.workers))
+    if args.top:
+        results = heapq.nlargest(args.top, results, key=lambda r: r[1]['score'])
+    elif args.sort:
+        results = sorted(results, key=lambda r: r[1]['score'], reverse=True)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for job_id, result in results:
+            out.write(json.dumps({'id': job_id, **result}) + '\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    print(f"Scored {scored} jobs in {elapsed:.2f}s ({scored / max(elapsed, 1e-9):.0f} jobs/s)",
+          file=sys.stderr)
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Compute match score between a job description and a user profile JSON.")
-    parser.add_argument("--job", "-j", required=True,
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--job", "-j",
                         help="Path to a text file containing the job description.")
+    source.add_argument("--jobs",
+                        help="Directory of .txt job descriptions or a JSONL file; "
+                             "writes one JSON result per line.")
     parser.add_argument("--profile", "-p", required=True,
                         help="Path to a JSON file containing the user profile.")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                        help="Batch mode: worker processes (default: CPU count).")
+    parser.add_argument("--top", type=int, default=None,
+                        help="Batch mode: only output the N best matches, best first.")
+    parser.add_argument("--sort", action="store_true",
+                        help="Batch mode: output all results sorted by score.")
+    parser.add_argument("--output", "-o",
+                        help="Batch mode: write JSONL here instead of stdout.")
+    parser.add_argument("--sentiment", choices=sorted(SENTIMENT_BACKENDS), default='textblob',
+                        help="Sentiment backend for the tone score (lexicon is faster, approximate).")
     args = parser.parse_args()
-
-    # Load job description
-    with open(args.job, 'r', encoding='utf-8') as f:
-        job_desc = f.read()
+    set_sentiment_backend(args.sentiment)
 
     # Load profile JSON
     with open(args.profile, 'r', encoding='utf-8') as f:
         profile_json = f.read()
 
+    if args.jobs:
+        run_batch(args, profile_json)
+        return
+
+    # Load job description
+    with open(args.job, 'r', encoding='utf-8') as f:
+        job_desc = f.read()
+
     # Compute match
     result = match_score(job_desc, profile_json)
 
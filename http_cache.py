@@ -0,0 +1,60 @@
+import hashlib
+import json
+import os
+import tempfile
+
+
+class ResponseCache:
+    """
+    On-disk cache of HTTP validators and the jobs parsed from each response.
+
+    Each (url, params) pair maps to one JSON file holding the ETag and
+    Last-Modified headers of the last 200 response plus its parsed jobs,
+    so a 304 Not Modified can be answered without re-parsing the page.
+    """
+
+    def __init__(self, cache_dir: str = '.scrape_cache'):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url: str, params=None) -> str:
+        key = json.dumps([url, params or {}], sort_keys=True)
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, url: str, params=None):
+        """
+        Return the cached entry dict, or None if missing or unreadable.
+        """
+        try:
+            with open(self._path(url, params), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url: str, params, response, jobs: list):
+        """
+        Store jobs parsed from response if it carries a validator.
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        entry = {'url': url, 'etag': etag, 'last_modified': last_modified, 'jobs': jobs}
+        # Write atomically so concurrent scrapes never read a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp, self._path(url, params))
+
+    @staticmethod
+    def conditional_headers(entry) -> dict:
+        """
+        Build If-None-Match / If-Modified-Since headers from a cached entry.
+        """
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
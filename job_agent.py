@@ -1,14 +1,18 @@
 import json
 import time
 import logging
-from apscheduler.schedulers.blocking import BlockingScheduler
 from job_scraper import JobScraper
-from job_cleaner import clean_pipeline
+from job_cleaner import clean_pipeline, iter_clean
 from job_categorizer import JobCategorizer
 from job_ranker import JobRanker
-from resume_star_enhancer import enhance_with_star
-import smtplib
-import requests
+from job_history import PostingHistory, posting_key
+from job_index import JobIndex
+from resume_star_enhancer import ParsedResume, enhance_many
+from run_log import RunLog, RunTimer
+from notify_payload import email_message, payload_settings, slack_text
+
+# apscheduler, smtplib and requests are imported where they are used so a
+# one-shot run does not pay for them at import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -22,58 +26,235 @@ class JobSearchAgent:
       2. Clean data via clean_pipeline
       3. Categorize via JobCategorizer
       4. Score via JobRanker
-      5. Rewrite resume bullets via enhance_with_star
+      5. Rewrite resume bullets via ParsedResume (enhance_with_star)
       6. Notify via email or Slack
 
     All inputs/outputs are JSON-friendly.
+
+    fetch_and_process(stream=True) runs steps 1-4 as a generator pipeline:
+    postings are cleaned, categorized and fed to JobRanker.rank_jobs' bounded
+    top-N heap as each site finishes, so only the top_n best postings and the
+    dedup index (one title per distinct posting) are held rather than every
+    scraped posting.
+
+    With index_path, cleaned postings are also added to a JobIndex
+    (self.index) loaded from and saved to that file, so keyword and skill
+    queries over everything seen are answered from posting lists. The index
+    keeps every posting it was given, so it is off (None) by default.
+
+    run() wraps fetch_and_process and notify with per-stage wall/CPU time and
+    item counts (see run_log.RunTimer), appended to run_log_path as JSONL.
+    Postings are recorded in the history only after they were delivered, so
+    a failed notification is retried with the same postings next run.
     """
-    def __init__(self, profile, site_configs, notify_cfg):
+    def __init__(self, profile, site_configs, notify_cfg, history_path=None,
+                 scrape_cache_dir=None, top_n=5, index_path=None, enhance_seed=None,
+                 enhance_workers=1, run_log_path=None, dispatcher=None):
         # profile: dict of user preferences for scoring & resume enhancement
         # site_configs: list of site config dicts for JobScraper
-        # notify_cfg: dict with email or slack settings
+        # notify_cfg: dict with email or slack settings, plus an optional 'payload'
+        #   dict sizing the message (see notify_payload.PAYLOAD_DEFAULTS)
+        # history_path: optional SQLite file; when set, postings seen in earlier
+        #   runs are skipped unless their description changed
+        # scrape_cache_dir: optional directory for the scraper's conditional-GET cache
+        # top_n: number of ranked jobs to enhance and report
+        # index_path: optional JSON file the posting index is loaded from and saved
+        #   to; without it no index is kept
+        # enhance_seed: when set, resume enhancement is deterministic for this seed
+        # enhance_workers: processes for resume enhancement; 1 enhances in-process,
+        #   None uses the CPU count once top_n reaches
+        #   resume_star_enhancer.PARALLEL_MIN_JOBS
+        # run_log_path: optional JSONL file run() appends per-stage timings to
+        # dispatcher: optional notifier.NotificationDispatcher; when set, notify()
+        #   queues messages for background delivery instead of sending inline
         self.profile = profile
         self.scraper = JobScraper(site_configs,
                                   remote=profile.get('remote_preference'),
                                   full_time=profile.get('full_time'),
-                                  min_salary=profile.get('desired_salary'))
+                                  min_salary=profile.get('desired_salary'),
+                                  cache_dir=scrape_cache_dir)
         self.cleaner = clean_pipeline
         self.categorizer = JobCategorizer()
         self.ranker = JobRanker()
         self.notify_cfg = notify_cfg
+        self.history = PostingHistory(history_path) if history_path else None
+        self.top_n = top_n
+        self.index_path = index_path
+        self.index = JobIndex.load(index_path) if index_path else None
+        self.enhance_seed = enhance_seed
+        self.enhance_workers = enhance_workers
+        self._parsed_resume = None
+        self.run_log = RunLog(run_log_path) if run_log_path else None
+        self.dispatcher = dispatcher
 
-    def fetch_and_process(self, query=None):
-        logging.info('Scraping jobs...')
-        raw_jobs = self.scraper.scrape_all(query=query)
-        logging.info(f'Fetched {len(raw_jobs)} raw jobs')
+    def run(self, query=None, stream=False) -> dict:
+        """
+        One scheduled run: fetch and process, notify, and only then record
+        the run's postings in the history, timed per stage. A run that
+        ranks no jobs sends no notification.
+        Returns the run summary, which is also appended to the run log.
+        """
+        timer = RunTimer()
+        try:
+            payload, seen_keys = self._process(query, stream, timer)
+            if payload['ranked_jobs']:
+                with timer.stage('notify', items=len(payload['ranked_jobs'])):
+                    delivered = self.deliver(payload)
+            else:
+                # Nothing new to report: send nothing, but the run succeeded
+                logging.info('No matching jobs; skipping notification')
+                delivered = True
+            if delivered:
+                self.mark_seen(seen_keys)
+        except Exception as e:
+            self._log_run(timer.summary('error', error=repr(e)))
+            raise
+        summary = timer.summary() if delivered else timer.summary('undelivered')
+        self._log_run(summary)
+        return summary
 
-        logging.info('Cleaning jobs...')
-        jobs = self.cleaner(raw_jobs)
-        logging.info(f'{len(jobs)} jobs after cleaning')
+    def _log_run(self, summary):
+        stages = ', '.join(f"{s['stage']} {s['wall_s']:.2f}s" for s in summary['stages'])
+        logging.info(f"Run {summary['status']} in {summary['wall_s']:.2f}s ({stages})")
+        if self.run_log is not None:
+            self.run_log.write(summary)
 
-        logging.info('Categorizing jobs...')
-        for job in jobs:
-            tags = self.categorizer.categorize(job.get('description', ''))
-            job.update(tags)
+    def deliver(self, payload) -> bool:
+        """
+        Notify and wait for delivery. With a dispatcher, waits for its queue
+        to drain and returns False if any message was given up on; inline
+        sends raise on failure.
+        """
+        failed = self.dispatcher.failed if self.dispatcher is not None else 0
+        self.notify(payload)
+        if self.dispatcher is None:
+            return True
+        self.dispatcher.flush()
+        return self.dispatcher.failed == failed
 
-        logging.info('Ranking jobs...')
-        ranked_json = self.ranker.rank(jobs, self.profile, top_n=5)
-        ranked = json.loads(ranked_json)['ranked_jobs']
+    def mark_seen(self, seen_keys):
+        """
+        Record posting keys from a delivered run so later runs skip them.
+        """
+        if self.history is not None:
+            self.history.mark_keys_seen(seen_keys)
+
+    def fetch_and_process(self, query=None, stream=False, timer=None):
+        """
+        Scrape, clean, categorize, rank and enhance; returns the payload.
+
+        The posting history is not updated here, since nothing has been
+        delivered yet: run() records the postings once notify succeeds.
+        """
+        return self._process(query, stream, timer)[0]
+
+    def _process(self, query, stream, timer):
+        # timer: optional RunTimer collecting per-stage timings
+        timer = timer or RunTimer()
+        if stream:
+            ranked, seen_keys = self._rank_streaming(query, timer)
+        else:
+            ranked, seen_keys = self._rank_batch(query, timer)
 
         logging.info('Enhancing resume for top jobs...')
-        enhanced_resumes = {}
-        original_resume = self.profile.get('resume_text', '')
-        for entry in ranked:
-            job = entry['job']
-            jd = job.get('description', '')
-            enhanced = enhance_with_star(original_resume, jd)
-            enhanced_resumes[job.get('source') + '_' + job.get('title')] = enhanced
+        with timer.stage('enhance', items=len(ranked)):
+            enhanced_resumes = self.enhance(ranked)
 
         payload = {
             'timestamp': time.time(),
             'ranked_jobs': ranked,
             'enhanced_resumes': enhanced_resumes
         }
-        return payload
+        if self.index is not None:
+            self.index.save(self.index_path)
+        return payload, seen_keys
+
+    def enhance(self, ranked):
+        """
+        STAR-enhance the resume for each ranked job, keyed by source_title.
+        """
+        jobs = [entry['job'] for entry in ranked]
+        enhanced = enhance_many(self.parsed_resume, [job.get('description', '') for job in jobs],
+                                seed=self.enhance_seed, workers=self.enhance_workers)
+        return {job.get('source') + '_' + job.get('title'): text
+                for job, text in zip(jobs, enhanced)}
+
+    @property
+    def parsed_resume(self):
+        # Parsed once and reused across jobs and runs; re-parsed if the resume changes
+        text = self.profile.get('resume_text', '')
+        if self._parsed_resume is None or self._parsed_resume.text != text:
+            self._parsed_resume = ParsedResume(text)
+        return self._parsed_resume
+
+    def _rank_batch(self, query, timer):
+        logging.info('Scraping jobs...')
+        with timer.stage('scrape') as stage:
+            raw_jobs = self.scraper.scrape_all(query=query, concurrent=True)
+            stage['items'] = len(raw_jobs)
+        logging.info(f'Fetched {len(raw_jobs)} raw jobs')
+
+        if self.history is not None:
+            with timer.stage('history') as stage:
+                raw_jobs = self.history.filter_new(raw_jobs)
+                stage['items'] = len(raw_jobs)
+            logging.info(f'{len(raw_jobs)} new or changed jobs since last run')
+
+        logging.info('Cleaning jobs...')
+        with timer.stage('clean') as stage:
+            jobs = self.cleaner(raw_jobs)
+            stage['items'] = len(jobs)
+        logging.info(f'{len(jobs)} jobs after cleaning')
+
+        logging.info('Categorizing jobs...')
+        with timer.stage('categorize', items=len(jobs)):
+            all_tags = self.categorizer.categorize_many([job.get('description', '') for job in jobs])
+            for job, tags in zip(jobs, all_tags):
+                job.update(tags)
+            if self.index is not None:
+                self.index.add_many(jobs)
+
+        logging.info('Ranking jobs...')
+        with timer.stage('rank', items=len(jobs)):
+            ranked = self.ranker.rank_jobs(jobs, self.profile, top_n=self.top_n)
+        seen_keys = [posting_key(job) for job in raw_jobs] if self.history is not None else []
+        return ranked, seen_keys
+
+    def _rank_streaming(self, query, timer):
+        logging.info('Streaming scrape/clean/categorize/rank...')
+        seen_keys = []
+        counter = {'jobs': 0}
+        # Stages are interleaved in the generator pipeline, so they are timed as one
+        with timer.stage('scrape_clean_categorize_rank') as stage:
+            raw_jobs = self.scraper.iter_scrape(query=query)
+            if self.history is not None:
+                raw_jobs = self._record_keys(self.history.iter_new(raw_jobs), seen_keys)
+            ranked = self.ranker.rank_jobs(self._categorized(iter_clean(raw_jobs), counter),
+                                           self.profile, top_n=self.top_n)
+            stage['items'] = counter['jobs']
+        logging.info(f"Ranked {counter['jobs']} cleaned jobs")
+        return ranked, seen_keys
+
+    def _categorized(self, jobs, counter):
+        for job in jobs:
+            job.update(self.categorizer.categorize(job.get('description', '')))
+            if self.index is not None:
+                self.index.add(job)
+            counter['jobs'] += 1
+            yield job
+
+    @staticmethod
+    def _record_keys(jobs, seen_keys):
+        for job in jobs:
+            seen_keys.append(posting_key(job))
+            yield job
+
+    def close(self):
+        # Quit scraper browsers and connections, and close the history database;
+        # a dispatcher passed in is left for its owner to close
+        self.scraper.close()
+        if self.history is not None:
+            self.history.close()
 
     def notify(self, payload):
         # Email notification
@@ -84,8 +265,13 @@ class JobSearchAgent:
             self._send_slack(payload)
 
     def _send_email(self, payload):
+        # Compact, size-capped message; see notify_payload and notify_cfg['payload']
         cfg = self.notify_cfg['email']
-        msg = json.dumps(payload, indent=2)
+        msg = email_message(payload, cfg, payload_settings(self.notify_cfg))
+        if self.dispatcher is not None:
+            self.dispatcher.send_email(cfg, msg)
+            return
+        import smtplib
         server = smtplib.SMTP(cfg['smtp_server'], cfg.get('smtp_port', 587))
         server.starttls()
         server.login(cfg['username'], cfg['password'])
@@ -95,20 +281,51 @@ class JobSearchAgent:
 
     def _send_slack(self, payload):
         cfg = self.notify_cfg['slack_webhook']
-        text = '*Top Job Matches*\n'
-        for entry in payload['ranked_jobs']:
-            job = entry['job']
-            text += f"• {job['title']} at {job['company']} ({entry['score']}%) <{job['apply_link']}>\n"
-        requests.post(cfg['url'], json={'text': text})
+        text = slack_text(payload, payload_settings(self.notify_cfg)['max_bytes'])
+        if self.dispatcher is not None:
+            self.dispatcher.send_slack(cfg, {'text': text})
+            return
+        import requests
+        # A webhook error must raise, or run() would mark the postings seen
+        response = requests.post(cfg['url'], json={'text': text}, timeout=30)
+        response.raise_for_status()
         logging.info('Slack message sent')
 
-def schedule_agent(profile, site_configs, notify_cfg, interval_minutes=60):
-    agent = JobSearchAgent(profile, site_configs, notify_cfg)
-    scheduler = BlockingScheduler()
-    scheduler.add_job(lambda: agent.notify(agent.fetch_and_process(query=profile.get('query'))),
-                      'interval', minutes=interval_minutes)
+def schedule_agent(profile, site_configs, notify_cfg, interval_minutes=60, history_path=None,
+                   scrape_cache_dir=None, index_path=None, run_log_path=None, background=False):
+    """
+    Run the agent every interval_minutes.
+
+    Runs never overlap: a run still in progress when the next one is due
+    makes the scheduler skip that tick (max_instances=1), and ticks missed
+    meanwhile are coalesced into one. With background=True the runs go to a
+    BackgroundScheduler's thread pool and the started scheduler is returned
+    (call .shutdown() to stop); otherwise this call blocks.
+    """
+    agent = JobSearchAgent(profile, site_configs, notify_cfg, history_path=history_path,
+                           scrape_cache_dir=scrape_cache_dir, index_path=index_path,
+                           run_log_path=run_log_path)
+    return start_scheduler(agent.run, interval_minutes, background,
+                           kwargs={'query': profile.get('query')})
+
+
+def start_scheduler(run, interval_minutes, background=False, kwargs=None):
+    """
+    Schedule run(**kwargs) every interval_minutes with max_instances=1 and
+    coalesce=True. Returns the started BackgroundScheduler when background
+    is set; otherwise blocks.
+    """
+    if background:
+        from apscheduler.schedulers.background import BackgroundScheduler
+        scheduler = BackgroundScheduler()
+    else:
+        from apscheduler.schedulers.blocking import BlockingScheduler
+        scheduler = BlockingScheduler()
+    scheduler.add_job(run, 'interval', minutes=interval_minutes, kwargs=kwargs or {},
+                      max_instances=1, coalesce=True)
     logging.info(f'Starting scheduler: every {interval_minutes} minutes')
     scheduler.start()
+    return scheduler
 
 if __name__ == '__main__':
     # Load user profile, site configs, and notification settings from JSON files
@@ -120,4 +337,6 @@ if __name__ == '__main__':
         notify_cfg = json.load(f)
 
     # Kick off the scheduled agent
-    schedule_agent(profile, site_configs, notify_cfg, interval_minutes=120)
+    schedule_agent(profile, site_configs, notify_cfg, interval_minutes=120,
+                   history_path='job_history.db', scrape_cache_dir='.scrape_cache',
+                   run_log_path='agent_runs.jsonl')
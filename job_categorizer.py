@@ -1,10 +1,28 @@
 import re
+from pattern_index import PatternIndex
+from worker_pool import pool_map
+
+# Per-process categorizer used by categorize_many workers
+_worker_categorizer = None
+
+
+def _init_worker(categorizer_cls):
+    # Compile patterns once per worker process
+    global _worker_categorizer
+    _worker_categorizer = categorizer_cls()
+
+
+def _categorize_in_worker(job_text):
+    return _worker_categorizer.categorize(job_text)
+
 
 class JobCategorizer:
     """
     Categorizes a job listing by industry, role type (IC vs management),
     skill category (frontend, backend, data science, etc.), and remote/on-site status.
-    Uses keyword-based regex matching.
+    Uses keyword-based regex matching. All patterns are indexed in one
+    PatternIndex so each description is tokenized once and only patterns
+    whose leading keyword occurs are searched.
     """
 
     INDUSTRY_KEYWORDS = {
@@ -35,6 +53,9 @@ class JobCategorizer:
         'on_site': [r"\bon[- ]site\b", r"\bin[- ]office\b", r"\blocal\b"],
     }
 
+    # Smallest batch categorize_many hands to a process pool
+    PARALLEL_MIN_TEXTS = 2000
+
     def __init__(self):
         # Precompile regex patterns for speed
         self.industry_regex = {
@@ -53,6 +74,20 @@ class JobCategorizer:
             k: [re.compile(pat, re.IGNORECASE) for pat in pats]
             for k, pats in self.REMOTE_PATTERNS.items()
         }
+        # Single keyword automaton over every pattern; each group maps its
+        # labels to the pattern indexes they own
+        all_patterns = []
+        self._groups = {}
+        for name, keywords in (('industry', self.INDUSTRY_KEYWORDS),
+                               ('role_type', self.ROLE_KEYWORDS),
+                               ('skill_categories', self.SKILL_CATEGORIES),
+                               ('work_location', self.REMOTE_PATTERNS)):
+            labels = {}
+            for label, pats in keywords.items():
+                labels[label] = range(len(all_patterns), len(all_patterns) + len(pats))
+                all_patterns.extend(pats)
+            self._groups[name] = labels
+        self.matcher = PatternIndex(all_patterns, re.IGNORECASE)
 
     def categorize(self, job_text: str) -> dict:
         """
@@ -62,6 +97,41 @@ class JobCategorizer:
           - skill_categories (list)
           - work_location ('remote', 'on_site', or 'unspecified')
         """
+        hits = set(self.matcher.matching(job_text))
+        tags = {
+            'industry': 'unknown',
+            'role_type': 'unknown',
+            'skill_categories': [],
+            'work_location': 'unspecified'
+        }
+        # First matching label wins, in declaration order (management before IC)
+        for name in ('industry', 'role_type', 'work_location'):
+            for label, idxs in self._groups[name].items():
+                if any(i in hits for i in idxs):
+                    tags[name] = label
+                    break
+        tags['skill_categories'] = [label for label, idxs in self._groups['skill_categories'].items()
+                                    if any(i in hits for i in idxs)]
+        return tags
+
+    def categorize_many(self, texts, workers=None, chunksize=None) -> list:
+        """
+        Categorize many job texts, returning tags in input order.
+
+        Uses a process pool of `workers` (default: CPU count) with patterns
+        compiled once per worker, and chunks sized so each worker gets a
+        few batches. Small batches (< PARALLEL_MIN_TEXTS) or workers=1 run
+        in-process.
+        """
+        return pool_map(_categorize_in_worker, texts, workers, min_items=self.PARALLEL_MIN_TEXTS,
+                        chunksize=chunksize, initializer=_init_worker, initargs=(type(self),),
+                        local=self.categorize)
+
+    def categorize_naive(self, job_text: str) -> dict:
+        """
+        Reference implementation of categorize that searches every pattern
+        separately; kept for benchmarks.
+        """
         tags = {
             'industry': 'unknown',
             'role_type': 'unknown',
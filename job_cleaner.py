@@ -1,7 +1,11 @@
 import re
+from collections import Counter
 from difflib import SequenceMatcher
+# numpy is only needed once a dedup block grows large; imported on first use
+from lazy_import import np
 
-# Required fields for a valid job posting\ REQUIRED_FIELDS = ['title', 'company', 'location', 'description', 'apply_link']
+# Required fields for a valid job posting
+REQUIRED_FIELDS = ['title', 'company', 'location', 'description', 'apply_link']
 
 
 def normalize_text(text: str) -> str:
@@ -21,11 +25,180 @@ def is_similar(a: str, b: str, threshold: float = 0.85) -> bool:
     return ratio >= threshold
 
 
+class DedupIndex:
+    """
+    Incremental near-duplicate detector for job postings.
+
+    Two postings are duplicates when their company and location match
+    case-insensitively and their titles pass `is_similar`. Postings are
+    blocked on the exact (company, location) key, and inside a block kept
+    titles are bucketed by length so only titles that could reach the
+    threshold are compared. Candidates then go through difflib's
+    `real_quick_ratio` and `quick_ratio` upper bounds before the full
+    `ratio` call, so the result is identical to comparing every pair.
+
+    Blocks with at least LARGE_BLOCK titles (one employer posting many
+    roles in one location) also keep a character-count matrix, and the
+    `quick_ratio` bound is evaluated against the whole block in one NumPy
+    step; only titles that pass it get the full `ratio`. Each lookup is
+    still linear in the block size, but as one array operation rather than
+    a Python call per title.
+    """
+
+    # Block size at which the vectorized quick_ratio filter takes over
+    LARGE_BLOCK = 32
+
+    def __init__(self, title_threshold: float = 0.85):
+        self.title_threshold = title_threshold
+        # (company, location) -> {'titles': {title: slot},
+        #                         'by_len': {len: [(SequenceMatcher, slot)]},
+        #                         'seqs': [SequenceMatcher], 'slots': [slot],
+        #                         'chars': _CharCounts or None}
+        # Only titles are held, never the postings themselves
+        self._blocks = {}
+        # Kept postings so far; a kept posting's slot is its position among them
+        self.kept = 0
+        # Slot of the kept posting the last job passed to add() duplicated
+        # (None if it was kept)
+        self.last_match = None
+
+    def _length_window(self, n: int) -> range:
+        # ratio <= 2 * min(la, lb) / (la + lb), so lengths outside this window
+        # can never reach the threshold
+        t = self.title_threshold
+        if t <= 0:
+            return None
+        low = int(n * t / (2 - t)) if t < 2 else n + 1
+        high = int(n * (2 - t) / t) + 1
+        return range(max(low, 1), high + 1)
+
+    def match(self, job: dict):
+        """
+        Return the slot of the kept posting job duplicates, or None.
+        """
+        title = job.get('title', '')
+        if not title:
+            return None
+        key = (job.get('company', '').lower(), job.get('location', '').lower())
+        block = self._blocks.get(key)
+        if block is None:
+            return None
+
+        a = title.lower()
+        t = self.title_threshold
+        if t <= 1.0 and a in block['titles']:
+            return block['titles'][a]
+
+        if block['chars'] is not None:
+            # ratio >= t implies quick_ratio >= t, so only these can match
+            for i in block['chars'].quick_ratio_candidates(a, t):
+                sm = block['seqs'][i]
+                sm.set_seq1(a)
+                if sm.ratio() >= t:
+                    return block['slots'][i]
+            return None
+
+        window = self._length_window(len(a))
+        lengths = block['by_len'].keys() if window is None else window
+        for n in lengths:
+            for sm, slot in block['by_len'].get(n, ()):
+                sm.set_seq1(a)
+                if (sm.real_quick_ratio() >= t and sm.quick_ratio() >= t
+                        and sm.ratio() >= t):
+                    return slot
+        return None
+
+    def is_duplicate(self, job: dict) -> bool:
+        """
+        Return True if job matches a posting already added to the index.
+        """
+        return self.match(job) is not None
+
+    def add(self, job: dict) -> bool:
+        """
+        Add job to the index unless it duplicates a kept posting.
+        Returns True if the job was kept (as slot kept - 1); otherwise
+        last_match is the slot of the kept posting it duplicates.
+        """
+        self.last_match = self.match(job)
+        if self.last_match is not None:
+            return False
+        slot = self.kept
+        self.kept += 1
+        title = job.get('title', '')
+        if title:
+            key = (job.get('company', '').lower(), job.get('location', '').lower())
+            block = self._blocks.setdefault(
+                key, {'titles': {}, 'by_len': {}, 'seqs': [], 'slots': [], 'chars': None})
+            b = title.lower()
+            sm = SequenceMatcher(None, '', b)
+            block['titles'].setdefault(b, slot)
+            block['by_len'].setdefault(len(b), []).append((sm, slot))
+            block['seqs'].append(sm)
+            block['slots'].append(slot)
+            if block['chars'] is not None:
+                block['chars'].add(b)
+            elif len(block['seqs']) >= self.LARGE_BLOCK:
+                block['chars'] = _CharCounts([seq.b for seq in block['seqs']])
+        return True
+
+
+class _CharCounts:
+    """
+    Per-title character counts of one dedup block, as a growable matrix,
+    for evaluating difflib's quick_ratio against every title at once.
+    """
+
+    def __init__(self, titles):
+        self.cols = {}
+        self.counts = np.zeros((max(len(titles) * 2, 64), 32), dtype=np.int32)
+        self.lengths = np.zeros(self.counts.shape[0], dtype=np.int64)
+        self.n = 0
+        for title in titles:
+            self.add(title)
+
+    def add(self, title: str):
+        if self.n == self.counts.shape[0]:
+            self.counts = np.vstack([self.counts, np.zeros_like(self.counts)])
+            self.lengths = np.concatenate([self.lengths, np.zeros_like(self.lengths)])
+        for ch, count in Counter(title).items():
+            col = self.cols.setdefault(ch, len(self.cols))
+            if col == self.counts.shape[1]:
+                self.counts = np.hstack([self.counts, np.zeros_like(self.counts)])
+            self.counts[self.n, col] = count
+        self.lengths[self.n] = len(title)
+        self.n += 1
+
+    def quick_ratio_candidates(self, a: str, threshold: float):
+        """
+        Indexes of titles whose quick_ratio against a is >= threshold,
+        computed exactly as difflib does (2 * shared chars / total length).
+        """
+        known = [(self.cols[ch], count) for ch, count in Counter(a).items() if ch in self.cols]
+        if known:
+            cols, counts = zip(*known)
+            matches = np.minimum(self.counts[:self.n, list(cols)], counts).sum(axis=1)
+        else:
+            matches = np.zeros(self.n, dtype=np.int64)
+        total = len(a) + self.lengths[:self.n]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(total > 0, 2.0 * matches / total, 1.0)
+        return np.flatnonzero(ratio >= threshold)
+
+
 def deduplicate_jobs(jobs: list, title_threshold: float = 0.85) -> list:
     """
     Remove duplicate job postings based on title, company, and location similarity.
     Keeps the first occurrence.
     """
+    index = DedupIndex(title_threshold)
+    return [job for job in jobs if index.add(job)]
+
+
+def deduplicate_jobs_naive(jobs: list, title_threshold: float = 0.85) -> list:
+    """
+    Reference O(n^2) implementation of deduplicate_jobs, kept for benchmarks.
+    """
     unique = []
     for job in jobs:
         duplicate = False
@@ -40,33 +213,40 @@ def deduplicate_jobs(jobs: list, title_threshold: float = 0.85) -> list:
     return unique
 
 
+def normalize_job(job: dict) -> dict:
+    """
+    Return a copy of job with normalized text fields and tags.
+    """
+    norm_job = job.copy()
+    # Normalize required text fields
+    for field in ['title', 'company', 'location']:
+        if field in norm_job and norm_job[field]:
+            norm_job[field] = normalize_text(norm_job[field])
+    # Ensure tags are a list of lowercase strings
+    tags = norm_job.get('tags', [])
+    norm_job['tags'] = [t.lower().strip() for t in tags if isinstance(t, str)]
+    return norm_job
+
+
 def normalize_jobs(jobs: list) -> list:
     """
     Normalize text fields across job postings.
     """
-    normalized = []
-    for job in jobs:
-        norm_job = job.copy()
-        # Normalize required text fields
-        for field in ['title', 'company', 'location']:
-            if field in norm_job and norm_job[field]:
-                norm_job[field] = normalize_text(norm_job[field])
-        # Ensure tags are a list of lowercase strings
-        tags = norm_job.get('tags', [])
-        norm_job['tags'] = [t.lower().strip() for t in tags if isinstance(t, str)]
-        normalized.append(norm_job)
-    return normalized
+    return [normalize_job(job) for job in jobs]
+
+
+def is_complete(job: dict) -> bool:
+    """
+    Check that a job posting has every required field filled in.
+    """
+    return all(job.get(field) for field in REQUIRED_FIELDS)
 
 
 def filter_complete_jobs(jobs: list) -> list:
     """
     Filter out any job postings missing required fields or with empty strings.
     """
-    filtered = []
-    for job in jobs:
-        if all(job.get(field) for field in REQUIRED_FIELDS):
-            filtered.append(job)
-    return filtered
+    return [job for job in jobs if is_complete(job)]
 
 
 def clean_pipeline(jobs: list) -> list:
@@ -82,6 +262,23 @@ def clean_pipeline(jobs: list) -> list:
     unique = deduplicate_jobs(norm)
     return unique
 
+
+def iter_clean(jobs, dedup: DedupIndex = None):
+    """
+    Streaming form of clean_pipeline: yields cleaned postings one at a time
+    as they arrive, in the same order and with the same result as
+    clean_pipeline on the full list. Pass a DedupIndex to share duplicate
+    state across calls.
+    """
+    if dedup is None:
+        dedup = DedupIndex()
+    for job in jobs:
+        if not is_complete(job):
+            continue
+        norm_job = normalize_job(job)
+        if dedup.add(norm_job):
+            yield norm_job
+
 # Example usage
 if __name__ == '__main__':
     sample_jobs = [
@@ -0,0 +1,114 @@
+import hashlib
+import re
+import threading
+import time
+
+
+def _normalize(value) -> str:
+    return re.sub(r"\s+", " ", str(value or '').strip()).lower()
+
+
+def posting_fingerprint(job: dict) -> str:
+    """
+    Stable identity for a posting across runs.
+    Uses source + apply_link when a link is present, otherwise the
+    normalized title, company and location.
+    """
+    link = job.get('apply_link')
+    if link:
+        key = f"{job.get('source', '')}|{link.strip()}"
+    else:
+        key = '|'.join(_normalize(job.get(f)) for f in ('title', 'company', 'location'))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def description_hash(job: dict) -> str:
+    """
+    Hash of the whitespace/case-normalized description.
+    """
+    return hashlib.sha1(_normalize(job.get('description')).encode('utf-8')).hexdigest()
+
+
+def posting_key(job: dict) -> tuple:
+    """
+    (fingerprint, description_hash) pair recorded for a processed posting.
+    """
+    return posting_fingerprint(job), description_hash(job)
+
+
+class PostingHistory:
+    """
+    SQLite-backed record of postings processed in earlier runs.
+
+    Lets the agent skip postings it has already seen, unless their
+    description has changed since.
+    """
+
+    def __init__(self, path: str = 'job_history.db'):
+        self.path = path
+        self._lock = threading.Lock()
+        import sqlite3
+        # The scheduler runs jobs on worker threads, so share the connection
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS postings ('
+            ' fingerprint TEXT PRIMARY KEY,'
+            ' description_hash TEXT NOT NULL,'
+            ' first_seen REAL NOT NULL,'
+            ' last_seen REAL NOT NULL)'
+        )
+        self.conn.commit()
+
+    def _stored_hashes(self, fingerprints: list) -> dict:
+        stored = {}
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(fingerprints), 500):
+            chunk = fingerprints[i:i + 500]
+            rows = self.conn.execute(
+                'SELECT fingerprint, description_hash FROM postings WHERE fingerprint IN (%s)'
+                % ','.join('?' * len(chunk)), chunk)
+            stored.update(rows)
+        return stored
+
+    def filter_new(self, jobs: list) -> list:
+        """
+        Return postings that are unseen or whose description changed.
+        """
+        fingerprints = [posting_fingerprint(job) for job in jobs]
+        with self._lock:
+            stored = self._stored_hashes(list(set(fingerprints)))
+        return [job for job, fp in zip(jobs, fingerprints)
+                if stored.get(fp) != description_hash(job)]
+
+    def iter_new(self, jobs):
+        """
+        Lazily yield postings that are unseen or whose description changed.
+        """
+        for job in jobs:
+            if self.filter_new([job]):
+                yield job
+
+    def mark_seen(self, jobs: list):
+        """
+        Record postings as processed.
+        """
+        self.mark_keys_seen([posting_key(job) for job in jobs])
+
+    def mark_keys_seen(self, keys: list):
+        """
+        Record (fingerprint, description_hash) pairs from posting_key as processed.
+        """
+        now = time.time()
+        rows = [(fp, desc_hash, now, now) for fp, desc_hash in keys]
+        with self._lock:
+            self.conn.executemany(
+                'INSERT INTO postings (fingerprint, description_hash, first_seen, last_seen)'
+                ' VALUES (?, ?, ?, ?)'
+                ' ON CONFLICT(fingerprint) DO UPDATE SET'
+                ' description_hash = excluded.description_hash,'
+                ' last_seen = excluded.last_seen', rows)
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,177 @@
+import json
+import os
+import re
+import tempfile
+from collections import Counter
+from job_history import posting_fingerprint, description_hash
+from job_matcher import SKILLS_SECTION
+
+# Index tokens: every word, so short terms like "go", "ml" and "ai" are
+# searchable (extract_keywords drops tokens under three characters)
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def posting_tokens(text: str) -> set:
+    """
+    Lowercased word tokens of text, as JobIndex stores and queries them.
+    """
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
+def posting_skills(job: dict) -> set:
+    """
+    Normalized skills of a posting: its 'skills' field plus the
+    comma-separated items of a "Skills:" line in the description.
+    """
+    skills = {str(s).strip().lower() for s in job.get('skills') or ()}
+    match = SKILLS_SECTION.search(job.get('description') or '')
+    if match:
+        skills.update(s.strip().lower() for s in match.group(1).split(','))
+    skills.discard('')
+    return skills
+
+
+class JobIndex:
+    """
+    In-memory inverted index over cleaned postings.
+
+    Maps lowercased description/title tokens (posting_tokens) and skills
+    to posting ids (posting_fingerprint), so keyword queries and
+    skill-overlap counts are answered by intersecting posting lists
+    instead of rescanning descriptions. Postings are added incrementally;
+    re-adding a posting whose description changed replaces its old
+    entries. save/load persist the index as JSON.
+    """
+
+    def __init__(self):
+        # posting id -> {'hash': ..., 'tokens': set, 'skills': set}
+        self.docs = {}
+        self._tokens = {}
+        self._skills = {}
+
+    def __len__(self):
+        return len(self.docs)
+
+    def __contains__(self, posting_id):
+        return posting_id in self.docs
+
+    def add(self, job: dict) -> str:
+        """
+        Index a posting and return its id. Unchanged postings are skipped.
+        """
+        posting_id = posting_fingerprint(job)
+        desc_hash = description_hash(job)
+        doc = self.docs.get(posting_id)
+        if doc is not None:
+            if doc['hash'] == desc_hash:
+                return posting_id
+            self.remove(posting_id)
+        text = f"{job.get('title') or ''}\n{job.get('description') or ''}"
+        self._insert(posting_id, desc_hash, posting_tokens(text), posting_skills(job))
+        return posting_id
+
+    def add_many(self, jobs) -> list:
+        return [self.add(job) for job in jobs]
+
+    def _insert(self, posting_id, desc_hash, tokens, skills):
+        self.docs[posting_id] = {'hash': desc_hash, 'tokens': tokens, 'skills': skills}
+        for token in tokens:
+            self._tokens.setdefault(token, set()).add(posting_id)
+        for skill in skills:
+            self._skills.setdefault(skill, set()).add(posting_id)
+
+    def remove(self, posting_id: str) -> bool:
+        """
+        Drop a posting from the index. Returns False if it was not indexed.
+        """
+        doc = self.docs.pop(posting_id, None)
+        if doc is None:
+            return False
+        for postings, terms in ((self._tokens, doc['tokens']), (self._skills, doc['skills'])):
+            for term in terms:
+                ids = postings[term]
+                ids.discard(posting_id)
+                if not ids:
+                    del postings[term]
+        return True
+
+    def query(self, tokens=(), skills=()) -> set:
+        """
+        Ids of postings containing every token and every skill.
+        An empty query matches all postings.
+        """
+        lists = [self._tokens.get(t.lower(), set()) for t in tokens]
+        lists += [self._skills.get(s.strip().lower(), set()) for s in skills]
+        if not lists:
+            return set(self.docs)
+        # Intersect smallest-first so the working set only shrinks
+        lists.sort(key=len)
+        result = set(lists[0])
+        for ids in lists[1:]:
+            if not result:
+                break
+            result &= ids
+        return result
+
+    def skill_overlap(self, skills, ids=None) -> Counter:
+        """
+        Count, per posting, how many of `skills` it lists.
+        Postings with no overlap are absent; `ids` restricts the count.
+        """
+        counts = Counter()
+        for skill in {s.strip().lower() for s in skills}:
+            postings = self._skills.get(skill)
+            if postings:
+                counts.update(postings if ids is None else postings & ids)
+        return counts
+
+    def keyword_overlap(self, tokens, ids=None) -> Counter:
+        """
+        Count, per posting, how many of `tokens` occur in it.
+        """
+        counts = Counter()
+        for token in {t.lower() for t in tokens}:
+            postings = self._tokens.get(token)
+            if postings:
+                counts.update(postings if ids is None else postings & ids)
+        return counts
+
+    def save(self, path: str):
+        """
+        Write the index to path as JSON (atomically).
+        """
+        data = {pid: {'hash': doc['hash'], 'tokens': sorted(doc['tokens']),
+                      'skills': sorted(doc['skills'])}
+                for pid, doc in self.docs.items()}
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'JobIndex':
+        """
+        Read an index written by save; a missing file gives an empty index.
+        """
+        index = cls()
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return index
+        for pid, doc in data.items():
+            index._insert(pid, doc['hash'], set(doc['tokens']), set(doc['skills']))
+        return index
+
+
+if __name__ == '__main__':
+    index = JobIndex()
+    index.add_many([
+        {'title': 'Backend Engineer', 'company': 'Acme', 'location': 'Remote',
+         'description': 'Build services in Go and Python on Kubernetes.\nSkills: Python, Kubernetes, SQL'},
+        {'title': 'Data Scientist', 'company': 'Beta', 'location': 'Austin',
+         'description': 'Model churn with Python and pandas.\nSkills: Python, pandas'},
+    ])
+    print(len(index.query(tokens=['python', 'kubernetes'])))  # 1
+    print(len(index.query(tokens=['Go'])))  # 1
+    print(sorted(index.skill_overlap({'python', 'pandas'}).values()))  # [1, 2]
@@ -1,24 +1,240 @@
+import hashlib
 import json
 import re
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
+from worker_pool import pool_imap
 
-try:
-    from textblob import TextBlob
-except ImportError:
-    raise ImportError("Please install textblob: pip install textblob")
+# textblob (and NLTK behind it) and sqlite3 are imported on first use to
+# keep CLI startup fast
 
 # Predefined positive/negative tone keywords (example)
 POSITIVE_TONE = set(["collaborative", "innovative", "passionate", "motivated", "driven"])
 NEGATIVE_TONE = set(["independent", "autonomous", "self-driven"])
 
+# "Skills:" section of a job description, read by match_score and job_index
+SKILLS_SECTION = re.compile(r"Skills[:\\n](.*)", re.IGNORECASE)
 
-def compute_sentiment(text: str) -> float:
+
+class SentimentCache:
+    """
+    Content-hash keyed cache of sentiment scores.
+
+    Keeps up to maxsize scores in memory with LRU eviction. When path is
+    given, scores are also persisted to a SQLite file so they survive
+    across runs and processes.
+    """
+
+    def __init__(self, maxsize: int = 4096, path: str = None):
+        self.maxsize = maxsize
+        self.path = path
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.conn = None
+        if path:
+            import sqlite3
+            self.conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS sentiment (key TEXT PRIMARY KEY, polarity REAL NOT NULL)')
+            self.conn.commit()
+
+    @staticmethod
+    def key(text: str, namespace: str = '') -> str:
+        # namespace keeps scores from different sentiment backends apart
+        return hashlib.sha1(f'{namespace}\0{text}'.encode('utf-8')).hexdigest()
+
+    def _remember(self, key: str, value: float):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def get(self, text: str, namespace: str = ''):
+        """
+        Return the cached polarity for text, or None.
+        """
+        key = self.key(text, namespace)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            if self.conn is None:
+                return None
+            row = self.conn.execute('SELECT polarity FROM sentiment WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(self, text: str, value: float, namespace: str = ''):
+        key = self.key(text, namespace)
+        with self._lock:
+            self._remember(key, value)
+            if self.conn is not None:
+                self.conn.execute('INSERT OR REPLACE INTO sentiment (key, polarity) VALUES (?, ?)',
+                                  (key, value))
+                self.conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+
+    def close(self):
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+# Module-wide cache used by compute_sentiment; see configure_sentiment_cache
+_sentiment_cache = SentimentCache()
+
+
+def configure_sentiment_cache(maxsize: int = 4096, path: str = None) -> SentimentCache:
+    """
+    Replace the module-wide sentiment cache, e.g. to add an on-disk tier.
+    Pass maxsize=0 and no path to effectively disable caching.
+    """
+    global _sentiment_cache
+    _sentiment_cache.close()
+    _sentiment_cache = SentimentCache(maxsize, path)
+    return _sentiment_cache
+
+
+def _textblob():
+    try:
+        from textblob import TextBlob
+    except ImportError:
+        raise ImportError("Please install textblob: pip install textblob")
+    return TextBlob
+
+
+# Word polarities taken from TextBlob's lexicon for words common in job ads
+POLARITY_LEXICON = {
+    'able': 0.5, 'agile': 0.5, 'ambitious': 0.25, 'amazing': 0.6, 'autonomous': 0.4,
+    'available': 0.4, 'awesome': 1.0, 'awful': -1.0, 'bad': -0.7, 'beautiful': 0.85,
+    'best': 1.0, 'better': 0.5, 'boring': -1.0, 'brilliant': 0.9, 'busy': 0.1,
+    'certain': 0.21, 'clean': 0.37, 'clear': 0.1, 'comfortable': 0.4, 'complex': -0.3,
+    'cool': 0.35, 'creative': 0.5, 'curious': -0.1, 'difficult': -0.5, 'easy': 0.43,
+    'effective': 0.6, 'excellent': 1.0, 'exceptional': 0.67, 'excited': 0.38,
+    'exciting': 0.3, 'fair': 0.7, 'fantastic': 0.4, 'fast': 0.2, 'free': 0.4,
+    'friendly': 0.38, 'frustrating': -0.4, 'full': 0.35, 'fun': 0.3, 'glad': 0.5,
+    'good': 0.7, 'great': 0.8, 'happy': 0.8, 'hard': -0.29, 'healthy': 0.5,
+    'heavy': -0.2, 'high': 0.16, 'horrible': -1.0, 'humble': -0.2, 'ideal': 0.9,
+    'important': 0.4, 'impressive': 1.0, 'incredible': 0.9, 'innovative': 0.5,
+    'interesting': 0.5, 'kind': 0.6, 'large': 0.21, 'lazy': -0.25, 'limited': -0.07,
+    'major': 0.06, 'meaningful': 0.5, 'modern': 0.2, 'negative': -0.3, 'new': 0.14,
+    'nice': 0.6, 'outstanding': 0.5, 'passionate': -0.05, 'perfect': 1.0,
+    'pleasant': 0.73, 'poor': -0.4, 'positive': 0.23, 'proud': 0.8, 'quick': 0.33,
+    'real': 0.2, 'remarkable': 0.75, 'rewarding': 0.5, 'safe': 0.5, 'secure': 0.4,
+    'serious': -0.33, 'significant': 0.38, 'slow': -0.3, 'small': -0.25, 'smart': 0.21,
+    'strong': 0.43, 'successful': 0.75, 'superb': 1.0, 'supportive': 0.5,
+    'talented': 0.7, 'terrible': -1.0, 'tight': -0.18, 'top': 0.5, 'tough': -0.39,
+    'true': 0.35, 'unique': 0.38, 'warm': 0.6, 'weak': -0.38, 'wonderful': 1.0,
+    'worst': -1.0, 'wrong': -0.5, 'young': 0.1,
+}
+
+
+class SentimentBackend:
+    """
+    Interface for the tone score's sentiment polarity.
+
+    Subclasses implement polarity(text) returning a value in [-1, 1].
+    Backends that can score from extract_keywords' token counts override
+    polarity_from_keywords so match_score can reuse its tokenization.
+    `name` namespaces cached scores; `cacheable` says whether scores are
+    worth caching at all.
+    """
+    name = 'base'
+    cacheable = True
+
+    def polarity(self, text: str) -> float:
+        raise NotImplementedError
+
+    def polarity_from_keywords(self, text: str, keywords: Counter) -> float:
+        return self.polarity(text)
+
+
+class TextBlobBackend(SentimentBackend):
+    """
+    Reference backend: TextBlob pattern-analyzer polarity.
+    """
+    name = 'textblob'
+
+    def polarity(self, text: str) -> float:
+        return _textblob()(text).sentiment.polarity
+
+
+class LexiconBackend(SentimentBackend):
+    """
+    Fast backend: count-weighted mean polarity of lexicon words among the
+    tokens extract_keywords produces. No negation or intensifier handling.
+    """
+    name = 'lexicon'
+    cacheable = False
+
+    def __init__(self, lexicon: dict = None):
+        self.lexicon = POLARITY_LEXICON if lexicon is None else lexicon
+
+    def polarity(self, text: str) -> float:
+        return self.polarity_from_keywords(text, extract_keywords(text))
+
+    def polarity_from_keywords(self, text: str, keywords: Counter) -> float:
+        total = 0.0
+        count = 0
+        for token, n in keywords.items():
+            value = self.lexicon.get(token)
+            if value is not None:
+                total += value * n
+                count += n
+        return total / count if count else 0.0
+
+
+SENTIMENT_BACKENDS = {
+    'textblob': TextBlobBackend,
+    'lexicon': LexiconBackend,
+}
+
+# Module-wide backend used by compute_sentiment; see set_sentiment_backend
+_sentiment_backend = TextBlobBackend()
+
+
+def set_sentiment_backend(backend) -> SentimentBackend:
+    """
+    Choose the sentiment backend by name ('textblob', 'lexicon') or instance.
     """
-    Compute sentiment polarity of text using TextBlob.
+    global _sentiment_backend
+    if isinstance(backend, str):
+        if backend not in SENTIMENT_BACKENDS:
+            raise ValueError(f"Unknown sentiment backend: {backend}")
+        backend = SENTIMENT_BACKENDS[backend]()
+    _sentiment_backend = backend
+    return backend
+
+
+def compute_sentiment(text: str, keywords: Counter = None) -> float:
+    """
+    Compute sentiment polarity of text with the configured backend
+    (TextBlob by default).
     Returns a polarity score between -1 (negative) and 1 (positive).
+    Pass keywords (extract_keywords(text)) to let token-based backends skip
+    re-tokenizing. Cacheable backends' results are cached by content hash
+    (see SentimentCache).
     """
-    blob = TextBlob(text)
-    return blob.sentiment.polarity
+    backend = _sentiment_backend
+    if not backend.cacheable:
+        if keywords is not None:
+            return backend.polarity_from_keywords(text, keywords)
+        return backend.polarity(text)
+    cached = _sentiment_cache.get(text, backend.name)
+    if cached is not None:
+        return cached
+    if keywords is not None:
+        polarity = backend.polarity_from_keywords(text, keywords)
+    else:
+        polarity = backend.polarity(text)
+    _sentiment_cache.put(text, polarity, backend.name)
+    return polarity
 
 
 def extract_keywords(text: str) -> Counter:
@@ -31,6 +247,33 @@ def extract_keywords(text: str) -> Counter:
     return Counter(tokens)
 
 
+class CompiledProfile:
+    """
+    User profile parsed once for repeated scoring.
+
+    Holds the lowercased skill set, remote preference and values text, and
+    computes the values-text sentiment on first use, so scoring one profile
+    against many descriptions only does job-side work per call.
+    """
+
+    def __init__(self, profile: dict):
+        self.profile = profile
+        self.skills = set([s.lower() for s in profile.get('skills', [])])
+        self.remote_pref = profile.get('remote_preference', False)
+        self.values_text = ' '.join(profile.get('values', []))
+        self._sentiment = None
+
+    @classmethod
+    def from_json(cls, user_profile_json: str) -> 'CompiledProfile':
+        return cls(json.loads(user_profile_json))
+
+    @property
+    def sentiment(self) -> float:
+        if self._sentiment is None:
+            self._sentiment = compute_sentiment(self.values_text)
+        return self._sentiment
+
+
 def match_score(job_desc: str, user_profile_json: str) -> dict:
     """
     Compute a match score between a job description and a user profile.
@@ -45,11 +288,16 @@ def match_score(job_desc: str, user_profile_json: str) -> dict:
       - score: int match score [0-100]
       - reasons: list of strings explaining contributing factors
     """
-    # Parse profile
-    profile = json.loads(user_profile_json)
-    user_skills = set([s.lower() for s in profile.get('skills', [])])
-    user_values = set([v.lower() for v in profile.get('values', [])])
-    remote_pref = profile.get('remote_preference', False)
+    return match_score_compiled(job_desc, CompiledProfile.from_json(user_profile_json))
+
+
+def match_score_compiled(job_desc: str, profile: CompiledProfile) -> dict:
+    """
+    match_score for a CompiledProfile; use this when scoring one profile
+    against many job descriptions.
+    """
+    user_skills = profile.skills
+    remote_pref = profile.remote_pref
 
     # Keyword relevance
     job_keywords = extract_keywords(job_desc)
@@ -58,10 +306,9 @@ def match_score(job_desc: str, user_profile_json: str) -> dict:
     keyword_score = min(1.0, keyword_overlap / 5.0)  # 5 overlapping keywords -> full points
 
     # Skill overlap
-    required_skills = set([s.lower() for s in profile.get('skills', [])])
     profile_skills_set = user_skills
     # For demo assume job description lists skills in a Skills: section
-    match = re.search(r"Skills[:\\n](.*)", job_desc, re.IGNORECASE)
+    match = SKILLS_SECTION.search(job_desc)
     if match:
         job_skills = set(map(str.strip, match.group(1).split(',')))
         skill_overlap_count = len(profile_skills_set & job_skills)
@@ -70,9 +317,8 @@ def match_score(job_desc: str, user_profile_json: str) -> dict:
         skill_score = 0.0
 
     # Tone matching via sentiment
-    job_sent = compute_sentiment(job_desc)
-    user_values_text = ' '.join(profile.get('values', []))
-    user_sent = compute_sentiment(user_values_text)
+    job_sent = compute_sentiment(job_desc, job_keywords)
+    user_sent = profile.sentiment
     tone_diff = abs(job_sent - user_sent)
     tone_score = max(0.0, 1.0 - tone_diff)  # closer sentiments give higher score
 
@@ -107,6 +353,52 @@ def match_score(job_desc: str, user_profile_json: str) -> dict:
     }
 
 
+# Per-process profile used by match_scores workers
+_worker_profile = None
+
+
+def _init_match_worker(profile, backend, cache_maxsize, cache_path):
+    global _worker_profile, _sentiment_backend, _sentiment_cache
+    _worker_profile = profile
+    _sentiment_backend = backend
+    # Open a fresh cache; SQLite connections must not cross a fork
+    _sentiment_cache = SentimentCache(cache_maxsize, cache_path)
+
+
+def _score_in_worker(item):
+    job_id, job_desc = item
+    return job_id, match_score_compiled(job_desc, _worker_profile)
+
+
+def match_scores(jobs, profile, workers=None, chunksize=16):
+    """
+    Score many job descriptions against one profile.
+
+    Parameters:
+    - jobs: iterable of (job_id, job_desc) pairs
+    - profile: CompiledProfile, profile dict, or profile JSON string
+    - workers: process count (default: CPU count); 1 scores in-process
+    - chunksize: descriptions sent to a worker per task
+
+    Yields (job_id, result) in input order. The profile is compiled once and
+    shipped to each worker once; input is consumed in bounded windows so
+    results stream without holding the whole corpus in memory. Inputs
+    smaller than one window (four chunks per worker) are scored in-process
+    to skip pool startup.
+    """
+    if isinstance(profile, str):
+        profile = CompiledProfile.from_json(profile)
+    elif isinstance(profile, dict):
+        profile = CompiledProfile(profile)
+    profile.sentiment  # compute once before shipping to workers
+
+    return pool_imap(_score_in_worker, jobs, workers, chunksize,
+                     initializer=_init_match_worker,
+                     initargs=(profile, _sentiment_backend, _sentiment_cache.maxsize,
+                               _sentiment_cache.path),
+                     local=lambda item: (item[0], match_score_compiled(item[1], profile)))
+
+
 # Example usage:
 if __name__ == "__main__":
     example_job = """
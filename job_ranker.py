@@ -1,4 +1,82 @@
+import heapq
 import json
+from operator import itemgetter
+# numpy is only needed by the batch scorers; imported on first use
+from lazy_import import np
+
+# Component order shared by the scalar and batch scorers
+COMPONENTS = ['skills', 'mission', 'salary', 'location', 'company_size', 'growth']
+
+
+class JobMatrix:
+    """
+    Column-array encoding of a job list for JobRanker.rank_batch.
+
+    Jobs are encoded once:
+      - skills / mission_keywords: sparse incidence over a term vocabulary
+        (CSR-style row pointers + term ids), so memory scales with the
+        number of tags rather than jobs x vocabulary
+      - salary_low / salary_high: float arrays
+      - work_location / company_size: integer codes into small vocabularies
+      - growth: float array
+    """
+
+    def __init__(self, jobs):
+        self.jobs = list(jobs)
+        n = len(self.jobs)
+        self.skill_vocab = {}
+        self.skill_ptr, self.skill_ids = self._encode_sets(
+            [job.get('skills', set()) for job in self.jobs], self.skill_vocab)
+        self.mission_vocab = {}
+        self.mission_ptr, self.mission_ids = self._encode_sets(
+            [job.get('mission_keywords', []) for job in self.jobs], self.mission_vocab)
+
+        self.salary_low = np.empty(n)
+        self.salary_high = np.empty(n)
+        for i, job in enumerate(self.jobs):
+            self.salary_low[i], self.salary_high[i] = job.get('salary_range', (0, float('inf')))
+
+        self.location_vocab = {}
+        self.location = self._encode_codes(
+            [job.get('work_location', 'unspecified') for job in self.jobs], self.location_vocab)
+        self.size_vocab = {}
+        self.company_size = self._encode_codes(
+            [job.get('company_size') for job in self.jobs], self.size_vocab)
+        self.growth = np.array([job.get('growth_potential', 0.0) for job in self.jobs], dtype=float)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    @staticmethod
+    def _encode_sets(values, vocab):
+        ptr = np.zeros(len(values) + 1, dtype=np.int64)
+        ids = []
+        for i, terms in enumerate(values):
+            row = {vocab.setdefault(t, len(vocab)) for t in terms}
+            ids.extend(row)
+            ptr[i + 1] = len(ids)
+        return ptr, np.array(ids, dtype=np.int64)
+
+    @staticmethod
+    def _encode_codes(values, vocab):
+        return np.array([vocab.setdefault(v, len(vocab)) for v in values], dtype=np.int64)
+
+    @staticmethod
+    def _overlap_counts(ptr, ids, vocab, term_sets):
+        # (jobs x len(term_sets)) count of each job's terms found in each set
+        member = np.zeros((len(vocab), len(term_sets)), dtype=np.int64)
+        for j, terms in enumerate(term_sets):
+            member[[vocab[t] for t in terms if t in vocab], j] = 1
+        cumulative = np.zeros((len(ids) + 1, len(term_sets)), dtype=np.int64)
+        np.cumsum(member[ids], axis=0, out=cumulative[1:])
+        return cumulative[ptr[1:]] - cumulative[ptr[:-1]]
+
+    def skill_overlap(self, skill_sets):
+        return self._overlap_counts(self.skill_ptr, self.skill_ids, self.skill_vocab, skill_sets)
+
+    def mission_overlap(self, keyword_sets):
+        return self._overlap_counts(self.mission_ptr, self.mission_ids, self.mission_vocab,
+                                    keyword_sets)
 
 class JobRanker:
     """
@@ -64,9 +142,36 @@ class JobRanker:
         # job['growth_potential'] is a number 0-1, profile may weight growth
         return job.get('growth_potential', 0.0)
 
-    def rank(self, jobs, profile, top_n=None):
+    def score(self, job, profile):
+        """
+        Score a single job against profile.
+        Returns (score 0-100, dict of component scores).
+        """
+        # Calculate component scores (keys in COMPONENTS order)
+        scores = {
+            'skills': self._score_skills(job, profile),
+            'mission': self._score_mission(job, profile),
+            'salary': self._score_salary(job, profile),
+            'location': self._score_location(job, profile),
+            'company_size': self._score_company_size(job, profile),
+            'growth': self._score_growth(job, profile)
+        }
+        # Weighted sum
+        total = 0.0
+        for k, v in scores.items():
+            total += self.weights.get(k, 0) * v
+        return round(total * 100), scores
+
+    def reasons(self, scores):
+        """
+        Explanation strings for a dict of component scores.
         """
-        Rank a list of job dicts based on profile preferences.
+        return [f"{k}: {v*100:.0f}% (weight {self.weights.get(k, 0)})"
+                for k, v in scores.items()]
+
+    def rank_jobs(self, jobs, profile, top_n=None):
+        """
+        Rank job dicts based on profile preferences.
 
         Each job dict should include keys:
           - skills: set of skills
@@ -83,40 +188,108 @@ class JobRanker:
           - location_preference: 'remote'/'on_site'/'either'
           - preferred_company_size: list or set
 
-        Returns a JSON string of ranked jobs with scores and reasons.
+        jobs may be any iterable; with top_n only the best top_n are held
+        in a heap (O(n log top_n)) and reasons are built only for them.
+        Ties keep input order.
+
+        Returns a list of {'job', 'score', 'reasons'} dicts, best first.
         """
-        ranked = []
-        for job in jobs:
-            reasons = []
-            # Calculate component scores
-            scores = {
-                'skills': self._score_skills(job, profile),
-                'mission': self._score_mission(job, profile),
-                'salary': self._score_salary(job, profile),
-                'location': self._score_location(job, profile),
-                'company_size': self._score_company_size(job, profile),
-                'growth': self._score_growth(job, profile)
-            }
-            # Weighted sum
-            total = 0.0
-            for k, v in scores.items():
-                w = self.weights.get(k, 0)
-                total += w * v
-                reasons.append(f"{k}: {v*100:.0f}% (weight {w})")
-
-            score = round(total * 100)
-            ranked.append({
-                'job': job,
-                'score': score,
-                'reasons': reasons
-            })
-
-        # Sort descending by score
-        ranked.sort(key=lambda x: x['score'], reverse=True)
+        scored = ((*self.score(job, profile), job) for job in jobs)
         if top_n:
-            ranked = ranked[:top_n]
+            best = heapq.nlargest(top_n, scored, key=itemgetter(0))
+        else:
+            best = sorted(scored, key=itemgetter(0), reverse=True)
+        return [{'job': job, 'score': score, 'reasons': self.reasons(scores)}
+                for score, scores, job in best]
+
+    def component_scores(self, matrix, profiles):
+        """
+        Vectorized component scores for every job in a JobMatrix against
+        every profile. Returns a dict of (jobs x profiles) float arrays
+        keyed like score()'s components.
+        """
+        n = len(matrix)
+        skill_sets = [set(p.get('desired_skills', set())) for p in profiles]
+        missions = [set(p.get('mission_keywords', [])) for p in profiles]
+        scores = {
+            'skills': matrix.skill_overlap(skill_sets)
+                      / np.maximum([len(s) for s in skill_sets], 1),
+            'mission': matrix.mission_overlap(missions)
+                       / np.maximum([len(m) for m in missions], 1),
+        }
 
-        return json.dumps({'ranked_jobs': ranked}, indent=2)
+        desired = np.array([p.get('desired_salary', 0) for p in profiles], dtype=float)
+        low, high = matrix.salary_low[:, None], matrix.salary_high[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diff = np.where(desired < low,
+                            (low - desired) / np.maximum(desired, 1),
+                            (desired - high) / np.maximum(high, 1))
+            scores['salary'] = np.where((low <= desired) & (desired <= high),
+                                        1.0, np.maximum(0.0, 1.0 - diff))
+
+        prefs = [p.get('location_preference') for p in profiles]
+        either = np.array([pref == 'either' for pref in prefs])
+        wanted = np.array([matrix.location_vocab.get(pref, -1) for pref in prefs])
+        unspecified = matrix.location_vocab.get('unspecified', -1)
+        location = matrix.location[:, None]
+        scores['location'] = (either | (location == unspecified)
+                              | (location == wanted)).astype(float)
+
+        size_pref = np.zeros((len(matrix.size_vocab), len(profiles)), dtype=bool)
+        for j, p in enumerate(profiles):
+            size_pref[[matrix.size_vocab[s] for s in p.get('preferred_company_size', [])
+                       if s in matrix.size_vocab], j] = True
+        scores['company_size'] = size_pref[matrix.company_size].astype(float)
+        scores['growth'] = np.broadcast_to(matrix.growth[:, None], (n, len(profiles)))
+        return scores
+
+    def rank_many(self, jobs, profiles, top_n=None, chunk_size=32):
+        """
+        Rank one job corpus against many profiles at once.
+
+        jobs may be a list of job dicts or a prebuilt JobMatrix; job-side
+        encoding is shared and scores are computed as a jobs x profiles
+        matrix, chunk_size profiles at a time to bound memory.
+        Returns one rank_jobs-style list per profile, in profile order.
+        """
+        matrix = jobs if isinstance(jobs, JobMatrix) else JobMatrix(jobs)
+        results = []
+        for start in range(0, len(profiles), chunk_size):
+            chunk = profiles[start:start + chunk_size]
+            scores = self.component_scores(matrix, chunk)
+            # Accumulate in COMPONENTS order so floats match the scalar path
+            total = np.zeros((len(matrix), len(chunk)))
+            for k in COMPONENTS:
+                total = total + self.weights.get(k, 0) * scores[k]
+            final = np.rint(total * 100).astype(np.int64)
+
+            orders = np.argsort(-final, axis=0, kind='stable')
+            if top_n:
+                orders = orders[:top_n]
+            for j in range(len(chunk)):
+                results.append([
+                    {'job': matrix.jobs[i],
+                     'score': int(final[i, j]),
+                     'reasons': self.reasons({k: float(scores[k][i, j]) for k in COMPONENTS})}
+                    for i in orders[:, j]])
+        return results
+
+    def rank_batch(self, jobs, profile, top_n=None):
+        """
+        NumPy equivalent of rank_jobs for large job lists.
+
+        jobs may be a list of job dicts or a prebuilt JobMatrix (encode once,
+        rank against many profiles). Returns the same list as rank_jobs.
+        """
+        return self.rank_many(jobs, [profile], top_n)[0]
+
+    def rank(self, jobs, profile, top_n=None):
+        """
+        JSON-string form of rank_jobs, kept for compatibility.
+
+        Returns a JSON string of ranked jobs with scores and reasons.
+        """
+        return json.dumps({'ranked_jobs': self.rank_jobs(jobs, profile, top_n)}, indent=2)
 
 # Example usage
 if __name__ == '__main__':
@@ -148,4 +321,7 @@ if __name__ == '__main__':
         'preferred_company_size': {'startup', 'mid'},
     }
     ranker = JobRanker()
-    print(ranker.rank(sample_jobs, user_profile))
+    for entry in ranker.rank_jobs(sample_jobs, user_profile):
+        print(f"Job {entry['job']['id']}: {entry['score']}")
+        for reason in entry['reasons']:
+            print(f"  - {reason}")
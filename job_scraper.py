@@ -1,11 +1,106 @@
 import json
 import re
-import time
-import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from http_cache import ResponseCache
+
+# requests, bs4 and selenium are imported inside the code paths that use
+# them, so building a scraper (or importing this module) stays cheap
+
+# Pulls every field of every listing in one round trip (selenium 'bulk_extract' mode)
+BULK_EXTRACT_JS = """
+const [itemSelector, fields, limit] = arguments;
+return Array.from(document.querySelectorAll(itemSelector)).slice(0, limit).map(elem => {
+    const job = {};
+    for (const [field, sel] of Object.entries(fields)) {
+        const sub = sel ? elem.querySelector(sel) : null;
+        if (!sub) {
+            job[field] = '';
+        } else if (field === 'apply_link') {
+            job[field] = sub.href || '';
+        } else {
+            job[field] = sub.innerText.trim();
+        }
+    }
+    return job;
+});
+"""
+
+class DriverPool:
+    """
+    Bounded pool of headless Chrome drivers.
+
+    Drivers are started on demand, up to `size`, and reused across scrapes.
+    A driver that raised during use is discarded rather than returned to
+    the pool. close() quits idle drivers immediately and in-use drivers as
+    soon as they are released.
+    """
+    def __init__(self, size=2):
+        self.size = size
+        self._idle = []
+        self._count = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _create(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--disable-gpu')
+        return webdriver.Chrome(options=chrome_options)
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError('DriverPool is closed')
+                if self._idle:
+                    return self._idle.pop()
+                if self._count < self.size:
+                    self._count += 1
+                    break
+                self._cond.wait()
+        # Start Chrome outside the lock; it takes seconds
+        try:
+            return self._create()
+        except Exception:
+            with self._cond:
+                self._count -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, driver, discard=False):
+        with self._cond:
+            if not (discard or self._closed):
+                self._idle.append(driver)
+                self._cond.notify()
+                return
+            self._count -= 1
+            self._cond.notify()
+        driver.quit()
+
+    @contextmanager
+    def driver(self):
+        drv = self.acquire()
+        try:
+            yield drv
+        except Exception:
+            self.release(drv, discard=True)
+            raise
+        self.release(drv)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._count -= len(idle)
+            self._cond.notify_all()
+        for drv in idle:
+            drv.quit()
+
 
 class JobScraper:
     """
@@ -16,56 +111,137 @@ class JobScraper:
       - url: listing page or API endpoint
       - method: 'api', 'html', or 'selenium'
       - selectors or json_paths: for parsing title, company, description, salary, tags, apply_link
+      - timeout (optional): seconds before an 'api'/'html' request is abandoned
+      - cache (optional): set False to opt a site out of the conditional-GET cache
+      - wait (optional, selenium): max seconds to wait for item_selector to appear
+      - bulk_extract (optional, selenium): read all fields of all items with a
+        single script call instead of one find_element per field
+
+    'api' and 'html' sites share one keep-alive session. When cache_dir is
+    given, responses are revalidated with ETag/Last-Modified and a 304
+    returns the jobs parsed on the previous run.
+
+    scrape_all(concurrent=True) scrapes sites on a thread pool, allowing at
+    most per_host_limit simultaneous requests to any one host; scrape_many
+    does the same for explicit (site config, query) pairs.
+
+    Chrome is only started when a 'selenium' site is scraped, from a
+    DriverPool of at most driver_pool_size browsers. Call close() (or use
+    the scraper as a context manager) to shut them down.
     """
-    def __init__(self, site_configs, remote=None, full_time=None, min_salary=None):
+    def __init__(self, site_configs, remote=None, full_time=None, min_salary=None,
+                 timeout=30, per_host_limit=2, cache_dir=None, driver_pool_size=2):
         self.site_configs = site_configs
         self.remote = remote
         self.full_time = full_time
         self.min_salary = min_salary
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--disable-gpu')
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.timeout = timeout
+        self.per_host_limit = per_host_limit
+        self._session = None
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        self.driver_pool_size = driver_pool_size
+        self._driver_pool = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def session(self):
+        with self._pool_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=max(len(self.site_configs), 1),
+                                      pool_maxsize=max(self.per_host_limit, 10))
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+
+    @property
+    def driver_pool(self):
+        with self._pool_lock:
+            if self._driver_pool is None:
+                self._driver_pool = DriverPool(self.driver_pool_size)
+            return self._driver_pool
 
     def scrape_site(self, config, query=None):
         jobs = []
         try:
-            if config['method'] == 'api':
-                resp = requests.get(config['url'], params=config.get('params', {}))
-                data = resp.json()
-                for item in data:
-                    job = {field: self._extract_json(item, path)
-                           for field, path in config['fields'].items()}
-                    job['source'] = config['name']
-                    jobs.append(job)
-            elif config['method'] == 'html':
-                text = requests.get(config['url']).text
-                soup = BeautifulSoup(text, 'html.parser')
-                for elem in soup.select(config['item_selector']):
-                    job = {'source': config['name']}
-                    for field, sel in config['fields'].items():
-                        sub = elem.select_one(sel)
-                        job[field] = sub.get_text(' ', strip=True) if sub else ''
-                    jobs.append(job)
+            if config['method'] in ('api', 'html'):
+                jobs = self._scrape_http(config)
             elif config['method'] == 'selenium':
-                self.driver.get(config['url'].format(query=query or ''))
-                time.sleep(config.get('wait', 2))
-                elems = self.driver.find_elements(By.CSS_SELECTOR, config['item_selector'])
-                for elem in elems[:config.get('limit', 20)]:
-                    job = {'source': config['name']}
-                    for field, sel in config['fields'].items():
-                        try:
-                            if field == 'apply_link':
-                                job[field] = elem.find_element(By.CSS_SELECTOR, sel).get_attribute('href')
-                            else:
-                                job[field] = elem.find_element(By.CSS_SELECTOR, sel).text
-                        except:
-                            job[field] = ''
-                    jobs.append(job)
+                with self.driver_pool.driver() as driver:
+                    jobs = self._scrape_selenium(driver, config, query)
         except Exception:
             pass
         return jobs
 
+    def _scrape_http(self, config):
+        params = config.get('params', {}) if config['method'] == 'api' else None
+        use_cache = self.cache is not None and config.get('cache', True)
+        entry = self.cache.get(config['url'], params) if use_cache else None
+        resp = self.session.get(config['url'], params=params,
+                                headers=ResponseCache.conditional_headers(entry),
+                                timeout=config.get('timeout', self.timeout))
+        if resp.status_code == 304 and entry is not None:
+            return entry['jobs']
+
+        jobs = []
+        if config['method'] == 'api':
+            data = resp.json()
+            for item in data:
+                job = {field: self._extract_json(item, path)
+                       for field, path in config['fields'].items()}
+                job['source'] = config['name']
+                jobs.append(job)
+        else:
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(resp.text, 'html.parser')
+            for elem in soup.select(config['item_selector']):
+                job = {'source': config['name']}
+                for field, sel in config['fields'].items():
+                    sub = elem.select_one(sel)
+                    job[field] = sub.get_text(' ', strip=True) if sub else ''
+                jobs.append(job)
+        if use_cache and resp.status_code == 200:
+            self.cache.put(config['url'], params, resp, jobs)
+        return jobs
+
+    def _scrape_selenium(self, driver, config, query=None):
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        jobs = []
+        driver.get(config['url'].format(query=query or ''))
+        try:
+            WebDriverWait(driver, config.get('wait', 10)).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, config['item_selector'])))
+        except TimeoutException:
+            return jobs
+        limit = config.get('limit', 20)
+        if config.get('bulk_extract'):
+            items = driver.execute_script(BULK_EXTRACT_JS, config['item_selector'],
+                                          config['fields'], limit)
+            for item in items:
+                job = {'source': config['name']}
+                job.update(item)
+                jobs.append(job)
+            return jobs
+        elems = driver.find_elements(By.CSS_SELECTOR, config['item_selector'])
+        for elem in elems[:limit]:
+            job = {'source': config['name']}
+            for field, sel in config['fields'].items():
+                try:
+                    if field == 'apply_link':
+                        job[field] = elem.find_element(By.CSS_SELECTOR, sel).get_attribute('href')
+                    else:
+                        job[field] = elem.find_element(By.CSS_SELECTOR, sel).text
+                except:
+                    job[field] = ''
+            jobs.append(job)
+        return jobs
+
     def _extract_json(self, data, path):
         # path: list of keys for nested JSON
         for key in path:
@@ -92,12 +268,84 @@ class JobScraper:
             filtered.append(job)
         return filtered
 
-    def scrape_all(self, query=None):
+    def scrape_all(self, query=None, concurrent=False, max_workers=8):
+        """
+        Scrape every configured site and return the filtered, merged job list.
+        With concurrent=True sites are fetched in parallel; the merged list
+        keeps site_configs order either way.
+        """
+        if concurrent and len(self.site_configs) > 1:
+            per_site = self._scrape_concurrent(query, max_workers)
+        else:
+            per_site = [self.scrape_site(config, query=query) for config in self.site_configs]
         all_jobs = []
-        for config in self.site_configs:
-            all_jobs.extend(self.scrape_site(config, query=query))
+        for jobs in per_site:
+            all_jobs.extend(jobs)
         return self.filter_jobs(all_jobs)
 
+    def close(self):
+        """
+        Release pooled HTTP connections and quit any Chrome drivers.
+        """
+        with self._pool_lock:
+            session, self._session = self._session, None
+            pool, self._driver_pool = self._driver_pool, None
+        if session is not None:
+            session.close()
+        if pool is not None:
+            pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def iter_scrape(self, query=None, max_workers=8):
+        """
+        Scrape sites concurrently and yield filtered jobs as each site
+        finishes, so downstream stages can start before the slowest board.
+        """
+        scrape = self._host_limited_scraper(query)
+        workers = max(min(max_workers, len(self.site_configs)), 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(scrape, config) for config in self.site_configs]
+            for future in as_completed(futures):
+                yield from self.filter_jobs(future.result())
+
+    def scrape_many(self, requests, max_workers=8):
+        """
+        Scrape a list of (site config, query) pairs concurrently, returning
+        each pair's unfiltered jobs in input order. Host limits are shared
+        across all pairs.
+        """
+        requests = list(requests)
+        if not requests:
+            return []
+        scrape = self._host_limited_scraper()
+        workers = min(max_workers, len(requests))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda pair: scrape(*pair), requests))
+
+    def _host_limited_scraper(self, query=None):
+        host_limits = {}
+        limits_lock = threading.Lock()
+
+        def scrape(config, site_query=query):
+            host = urlparse(config['url']).netloc
+            with limits_lock:
+                limit = host_limits.setdefault(host, threading.BoundedSemaphore(self.per_host_limit))
+            with limit:
+                return self.scrape_site(config, query=site_query)
+
+        return scrape
+
+    def _scrape_concurrent(self, query, max_workers):
+        scrape = self._host_limited_scraper(query)
+        workers = min(max_workers, len(self.site_configs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(scrape, self.site_configs))
+
 # Example site_configs list with placeholders for 20+ sites
 SITE_CONFIGS = [
     {
@@ -119,6 +367,6 @@ SITE_CONFIGS = [
 ]
 
 if __name__ == '__main__':
-    scraper = JobScraper(site_configs=SITE_CONFIGS, remote=True, full_time=True, min_salary=100000)
-    results = scraper.scrape_all(query='Data Scientist')
+    with JobScraper(site_configs=SITE_CONFIGS, remote=True, full_time=True, min_salary=100000) as scraper:
+        results = scraper.scrape_all(query='Data Scientist')
     print(json.dumps(results, indent=2))
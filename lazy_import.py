@@ -0,0 +1,35 @@
+import importlib
+
+# Optional heavy dependencies, imported on first use so that modules which
+# only need them on some paths (large dedup blocks, batch ranking) keep
+# their import time low and work without them otherwise.
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+    Raises ImportError with an install hint if the module is missing.
+    """
+
+    def __init__(self, name: str, package: str = None):
+        self._name = name
+        self._package = package or name
+        self._module = None
+
+    def __getattr__(self, attr):
+        # Only called for names not set in __init__; read state through
+        # __dict__ so a half-built instance (e.g. mid-copy) cannot recurse
+        state = self.__dict__
+        if '_name' not in state:
+            raise AttributeError(attr)
+        if state['_module'] is None:
+            try:
+                state['_module'] = importlib.import_module(state['_name'])
+            except ImportError:
+                raise ImportError(f"Please install {state['_package']}: "
+                                  f"pip install {state['_package']}")
+        return getattr(state['_module'], attr)
+
+
+# numpy: used by job_cleaner's large dedup blocks and job_ranker's batch scorers
+np = LazyModule('numpy')
@@ -0,0 +1,181 @@
+import logging
+import queue
+import threading
+import time
+
+# smtplib and requests are imported on first send
+
+# Email settings send_email refuses to queue without
+EMAIL_REQUIRED = ('smtp_server', 'from_addr', 'to_addrs')
+
+
+class NotificationDispatcher:
+    """
+    Background delivery of email and Slack notifications.
+
+    send_email/send_slack only enqueue a message, so a slow mail server or
+    webhook never stalls the pipeline thread. A single worker thread
+    drains the queue in batches of up to batch_size messages:
+      - emails are grouped by (smtp_server, smtp_port, username) and sent
+        over one SMTP connection per group, which is kept open between
+        batches and closed after idle_timeout seconds without work
+      - Slack posts share one pooled requests.Session
+    Each message is attempted up to max_retries times with exponential
+    backoff (backoff, 2*backoff, ...); a dropped SMTP connection is
+    reopened on retry. Messages that still fail are logged and dropped.
+
+    Email settings (notify_cfg['email']): smtp_server, smtp_port (587),
+    username, password, from_addr, to_addrs, and starttls (default True).
+    send_email raises ValueError when any of EMAIL_REQUIRED is missing.
+    """
+
+    def __init__(self, max_retries=3, backoff=1.0, batch_size=50, idle_timeout=60.0,
+                 timeout=30, maxsize=0):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.batch_size = batch_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.sent = 0
+        self.failed = 0
+        self._queue = queue.Queue(maxsize)
+        self._smtp = {}
+        self._session = None
+        self._thread = threading.Thread(target=self._worker, name='notifier', daemon=True)
+        self._thread.start()
+
+    def send_email(self, cfg: dict, message: str):
+        missing = [k for k in EMAIL_REQUIRED if not cfg.get(k)]
+        if missing:
+            raise ValueError(f"Email settings missing: {', '.join(missing)}")
+        self._queue.put(('email', cfg, message))
+
+    def send_slack(self, cfg: dict, body: dict):
+        self._queue.put(('slack', cfg, body))
+
+    def flush(self):
+        """
+        Block until every queued message has been delivered or given up on.
+        """
+        self._queue.join()
+
+    def close(self):
+        """
+        Deliver what is queued, then stop the worker and close connections.
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _worker(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                self._close_connections()
+                continue
+            batch = [item]
+            while item is not None and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+            stop = batch[-1] is None
+            messages = [m for m in batch if m is not None]
+            try:
+                self._deliver(messages)
+            except Exception:
+                # The worker must outlive any bad message, or flush() never returns
+                self.failed += len(messages)
+                logging.exception('Notification batch failed')
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                self._close_connections()
+                if self._session is not None:
+                    self._session.close()
+                return
+
+    def _deliver(self, messages):
+        emails = {}
+        for kind, cfg, content in messages:
+            if kind == 'email':
+                try:
+                    key = (cfg['smtp_server'], cfg.get('smtp_port', 587), cfg.get('username'))
+                    emails.setdefault(key, []).append((cfg, content))
+                except (KeyError, TypeError):
+                    self.failed += 1
+                    logging.exception('Email dropped: invalid settings')
+            else:
+                self._with_retries(self._post_slack, cfg, content, what='Slack message')
+        for key, group in emails.items():
+            for cfg, content in group:
+                self._with_retries(self._send_smtp, key, cfg, content, what='Email')
+
+    def _with_retries(self, send, *args, what):
+        for attempt in range(self.max_retries):
+            try:
+                send(*args)
+            except Exception:
+                if attempt == self.max_retries - 1:
+                    self.failed += 1
+                    logging.exception(f'{what} failed after {self.max_retries} attempts')
+                    return
+                time.sleep(self.backoff * 2 ** attempt)
+            else:
+                self.sent += 1
+                logging.info(f'{what} sent')
+                return
+
+    def _connection(self, key, cfg):
+        server = self._smtp.get(key)
+        if server is None:
+            import smtplib
+            server = smtplib.SMTP(cfg['smtp_server'], cfg.get('smtp_port', 587),
+                                  timeout=self.timeout)
+            if cfg.get('starttls', True):
+                server.starttls()
+            if cfg.get('username'):
+                server.login(cfg['username'], cfg['password'])
+            self._smtp[key] = server
+        return server
+
+    def _send_smtp(self, key, cfg, message):
+        server = self._connection(key, cfg)
+        try:
+            server.sendmail(cfg['from_addr'], cfg['to_addrs'], message)
+        except Exception:
+            # Reconnect on the next attempt rather than reuse a broken session
+            self._drop_connection(key)
+            raise
+
+    def _drop_connection(self, key):
+        server = self._smtp.pop(key, None)
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                server.close()
+
+    def _close_connections(self):
+        for key in list(self._smtp):
+            self._drop_connection(key)
+
+    @property
+    def session(self):
+        # Only the worker thread posts, so no lock is needed
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
+    def _post_slack(self, cfg, body):
+        response = self.session.post(cfg['url'], json=body, timeout=self.timeout)
+        response.raise_for_status()
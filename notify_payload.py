@@ -0,0 +1,177 @@
+import gzip
+import json
+
+# Defaults for notify_cfg['payload']
+PAYLOAD_DEFAULTS = {
+    'max_bytes': 50000,         # budget for one notification, attachments included
+    'description_chars': 300,   # descriptions are cut to this many characters
+    'max_reasons': 3,           # reasons kept per job
+    'format': 'json',           # email body: 'json' (compact) or 'table'
+    'attach': None,             # 'gzip' attaches the full payload as payload.json.gz
+}
+
+# Fields of a job that a notification shows
+JOB_FIELDS = ('title', 'company', 'location', 'salary', 'apply_link', 'source')
+
+
+def payload_settings(notify_cfg: dict) -> dict:
+    """
+    PAYLOAD_DEFAULTS overridden by notify_cfg['payload'].
+    """
+    return {**PAYLOAD_DEFAULTS, **(notify_cfg.get('payload') or {})}
+
+
+def _truncate(text, limit: int) -> str:
+    text = ' '.join(str(text or '').split())
+    return text if len(text) <= limit else text[:max(limit - 1, 0)].rstrip() + '…'
+
+
+def _size(obj) -> int:
+    return len(json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8'))
+
+
+def compact_job(entry: dict, description_chars: int, max_reasons: int) -> dict:
+    """
+    Project a ranked entry ({'job', 'score', 'reasons'}) onto JOB_FIELDS,
+    the score, the first reasons and a truncated description.
+    """
+    job = entry['job']
+    item = {f: job[f] for f in JOB_FIELDS if job.get(f)}
+    item['score'] = entry['score']
+    item['reasons'] = entry.get('reasons', [])[:max_reasons]
+    if description_chars:
+        item['description'] = _truncate(job.get('description'), description_chars)
+    return item
+
+
+def compact_payload(payload: dict, max_bytes: int = 50000, description_chars: int = 300,
+                    max_reasons: int = 3) -> dict:
+    """
+    Shrink a fetch_and_process payload to fit max_bytes of compact JSON.
+
+    Only JOB_FIELDS, score, reasons and a truncated description are kept
+    per job, and enhanced resumes are cut to description_chars. Over
+    budget, the payload is shrunk step by step: enhanced resumes dropped,
+    descriptions halved until gone, then the lowest-ranked jobs dropped.
+    'omitted' counts what was left out.
+    """
+    ranked = payload.get('ranked_jobs', [])
+    resumes = payload.get('enhanced_resumes', {})
+    chars = description_chars
+    keep_resumes = True
+    count = len(ranked)
+    while True:
+        compact = {
+            'timestamp': payload.get('timestamp'),
+            'ranked_jobs': [compact_job(entry, chars, max_reasons) for entry in ranked[:count]],
+        }
+        if keep_resumes and resumes:
+            compact['enhanced_resumes'] = {k: _truncate(v, description_chars)
+                                           for k, v in resumes.items()}
+        omitted = {'jobs': len(ranked) - count,
+                   'enhanced_resumes': 0 if keep_resumes else len(resumes)}
+        if any(omitted.values()):
+            compact['omitted'] = omitted
+        if _size(compact) <= max_bytes or count == 0:
+            return compact
+        if keep_resumes and resumes:
+            keep_resumes = False
+        elif chars:
+            chars = chars // 2 if chars > 40 else 0
+        else:
+            count -= 1
+
+
+def summary_table(compact: dict) -> str:
+    """
+    Plain-text table of a compact payload's jobs, best first.
+    """
+    rows = [('#', 'Score', 'Title', 'Company', 'Location', 'Link')]
+    for i, item in enumerate(compact['ranked_jobs'], 1):
+        rows.append((str(i), str(item['score']), _truncate(item.get('title'), 40),
+                     _truncate(item.get('company'), 25), _truncate(item.get('location'), 20),
+                     item.get('apply_link', '')))
+    widths = [max(len(row[c]) for row in rows) for c in range(len(rows[0]) - 1)]
+    lines = ['  '.join(cell.ljust(w) for cell, w in zip(row, widths)) + '  ' + row[-1]
+             for row in rows]
+    omitted = compact.get('omitted', {}).get('jobs')
+    if omitted:
+        lines.append(f'(+{omitted} more jobs not shown)')
+    return '\n'.join(lines)
+
+
+def email_message(payload: dict, email_cfg: dict, settings: dict) -> str:
+    """
+    Build the email for a payload within settings['max_bytes'].
+
+    The body is the compact payload as JSON, or a summary table with
+    format='table'. With attach='gzip' the full payload is attached as
+    gzipped JSON when it fits in what remains of the budget. The limit
+    applies to the encoded message, headers and MIME overhead included:
+    while it is over, the body budget is cut by the excess and the body
+    rebuilt, and the attachment is dropped if the body alone cannot make
+    room for it.
+    """
+    max_bytes = settings['max_bytes']
+    budget = max_bytes
+    attachment = None
+    if settings.get('attach') == 'gzip':
+        attachment = gzip.compress(json.dumps(payload, default=str).encode('utf-8'))
+        # base64 encoding grows the attachment by about a third
+        if len(attachment) * 4 // 3 < budget // 2:
+            budget -= len(attachment) * 4 // 3
+        else:
+            attachment = None
+    while True:
+        compact = compact_payload(payload, max_bytes=budget,
+                                  description_chars=settings['description_chars'],
+                                  max_reasons=settings['max_reasons'])
+        message = _build_email(compact, email_cfg, settings, attachment)
+        excess = len(message.encode('utf-8')) - max_bytes
+        if excess <= 0:
+            return message
+        if compact['ranked_jobs'] and budget > 0:
+            budget -= excess
+        elif attachment is not None:
+            attachment = None
+            budget = max_bytes
+        else:
+            # Headers alone exceed the limit; nothing left to cut
+            return message
+
+
+def _build_email(compact: dict, email_cfg: dict, settings: dict, attachment) -> str:
+    from email.message import EmailMessage
+    if settings.get('format') == 'table':
+        body = summary_table(compact)
+    else:
+        body = json.dumps(compact, separators=(',', ':'), default=str)
+
+    msg = EmailMessage()
+    msg['Subject'] = email_cfg.get('subject', 'Top Job Matches')
+    msg['From'] = email_cfg['from_addr']
+    msg['To'] = ', '.join(email_cfg['to_addrs'])
+    msg.set_content(body)
+    if attachment is not None:
+        msg.add_attachment(attachment, maintype='application', subtype='gzip',
+                           filename='payload.json.gz')
+    return msg.as_string()
+
+
+def slack_text(payload: dict, max_bytes: int) -> str:
+    """
+    Slack message listing the ranked jobs, cut to max_bytes.
+    """
+    lines = ['*Top Job Matches*']
+    size = len(lines[0].encode('utf-8'))
+    entries = payload['ranked_jobs']
+    for i, entry in enumerate(entries):
+        job = entry['job']
+        line = f"• {job['title']} at {job['company']} ({entry['score']}%) <{job['apply_link']}>"
+        # keep room for the trailing "+N more" note
+        if size + len(line.encode('utf-8')) + 40 > max_bytes:
+            lines.append(f'…and {len(entries) - i} more')
+            break
+        lines.append(line)
+        size += len(line.encode('utf-8')) + 1
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,68 @@
+import re
+
+WORD_PATTERN = re.compile(r"\w+")
+# Pattern text that guarantees a non-word character right after a literal
+_BOUNDARY_PATTERN = re.compile(r"\\b|\\\.|\\s|\\W|[ \-/,:]|\[[^\]\w\\^]+\](?![?*{])")
+_QUANTIFIERS = '?*+{'
+
+
+def leading_word(pattern: str):
+    r"""
+    Return the literal word a regex must start with at a word boundary,
+    e.g. 'on' for r"\bon[- ]site\b", or None when no such word can be
+    derived (no leading \b, alternation, or a literal that may run on
+    into more word characters).
+    """
+    if '|' in pattern or not pattern.startswith(r'\b'):
+        return None
+    rest = pattern
+    while rest.startswith(r'\b'):
+        rest = rest[2:]
+    m = re.match(r"\w+", rest)
+    if not m:
+        return None
+    remainder = rest[m.end():]
+    if remainder[:1] and remainder[0] in _QUANTIFIERS:
+        return None
+    if not _BOUNDARY_PATTERN.match(remainder):
+        return None
+    return m.group(0).lower()
+
+
+class PatternIndex:
+    """
+    Keyword automaton over a list of regex patterns.
+
+    Each pattern is indexed by the literal word it must start with. A text
+    is tokenized once into lowercase words; only patterns whose leading
+    word occurs are confirmed with their own compiled regex, so results
+    are identical to searching every pattern while most texts cost a
+    single tokenizing scan. Patterns with no indexable leading word are
+    always searched.
+    """
+
+    def __init__(self, patterns, flags=re.IGNORECASE):
+        self.patterns = [re.compile(p, flags) for p in patterns]
+        self._by_word = {}
+        self._always = []
+        for i, pat in enumerate(patterns):
+            word = leading_word(pat)
+            if word is None:
+                self._always.append(i)
+            else:
+                self._by_word.setdefault(word, []).append(i)
+
+    def candidates(self, text: str) -> list:
+        """
+        Indexes of patterns that may match text, in pattern order.
+        """
+        found = set(self._always)
+        for word in set(WORD_PATTERN.findall(text.lower())) & self._by_word.keys():
+            found.update(self._by_word[word])
+        return sorted(found)
+
+    def matching(self, text: str) -> list:
+        """
+        Indexes of patterns that match somewhere in text, in pattern order.
+        """
+        return [i for i in self.candidates(text) if self.patterns[i].search(text)]
@@ -1,4 +1,8 @@
 import re
+from bisect import bisect_right
+from functools import partial
+from pattern_index import PatternIndex
+from worker_pool import pool_map
 
 # Patterns for vague phrases and mapping to enriched suggestion templates
 VAGUE_PATTERNS = {
@@ -88,8 +92,31 @@ VAGUE_PATTERNS = {
 COMPILED_VAGUE = [(re.compile(pat, re.IGNORECASE), suggestion)
                   for pat, suggestion in VAGUE_PATTERNS.items()]
 
+# Keyword automaton over the same patterns, in the same order
+VAGUE_INDEX = PatternIndex(list(VAGUE_PATTERNS), re.IGNORECASE)
 
-def flag_vague_bullets(resume_text: str):
+# flag_many runs in-process below this many resumes
+PARALLEL_MIN_RESUMES = 200
+
+
+def _bullet_spans(resume_text: str) -> list:
+    # (start, end, bullet) for each '-' line, offsets into resume_text
+    spans = []
+    offset = 0
+    for raw in resume_text.splitlines(keepends=True):
+        line = raw.strip()
+        if line.startswith('-'):
+            bullet = line.lstrip('-').strip()
+            if bullet:
+                # skip leading whitespace, then the dashes and spaces before the text
+                start = (offset + len(raw) - len(raw.lstrip())
+                         + len(line) - len(line.lstrip('-').lstrip()))
+                spans.append((start, start + len(bullet), bullet))
+        offset += len(raw)
+    return spans
+
+
+def flag_vague_bullets(resume_text: str, all_suggestions: bool = False):
     """
     Identify vague bullets and provide enriched, factual suggestions.
 
@@ -97,6 +124,57 @@ def flag_vague_bullets(resume_text: str):
       - bullet: original text
       - issues: matched vague phrases
       - suggestion: enriched, example rewrite template
+      - suggestions: every matched template (only with all_suggestions=True)
+
+    The whole resume is scanned once: VAGUE_INDEX picks the patterns whose
+    leading word occurs anywhere, only those are run over the full text,
+    and hits are mapped back to bullets by offset. Results match
+    flag_vague_bullets_naive.
+    """
+    spans = _bullet_spans(resume_text)
+    if not spans:
+        return []
+    starts = [start for start, _, _ in spans]
+    # bullet index -> {pattern index: first matched phrase}
+    hits = {}
+    for i in VAGUE_INDEX.candidates(resume_text):
+        for match in VAGUE_INDEX.patterns[i].finditer(resume_text):
+            b = bisect_right(starts, match.start()) - 1
+            if b < 0 or match.end() > spans[b][1]:
+                continue
+            hits.setdefault(b, {}).setdefault(i, match.group(0))
+
+    flagged = []
+    for b in sorted(hits):
+        matched = sorted(hits[b])
+        item = {
+            'bullet': spans[b][2],
+            'issues': [hits[b][i] for i in matched],
+            'suggestion': COMPILED_VAGUE[matched[-1]][1]  # last matched template
+        }
+        if all_suggestions:
+            item['suggestions'] = [COMPILED_VAGUE[i][1] for i in matched]
+        flagged.append(item)
+    return flagged
+
+
+def flag_many(resumes, workers=None, chunksize=None, all_suggestions: bool = False) -> list:
+    """
+    Flag many resumes, returning one flag_vague_bullets result per resume
+    in input order.
+
+    Uses a process pool of `workers` (default: CPU count); small batches
+    (< PARALLEL_MIN_RESUMES) or workers=1 run in-process.
+    """
+    flag = partial(flag_vague_bullets, all_suggestions=all_suggestions)
+    return pool_map(flag, resumes, workers, min_items=PARALLEL_MIN_RESUMES,
+                    chunksize=chunksize, max_chunksize=100)
+
+
+def flag_vague_bullets_naive(resume_text: str):
+    """
+    Reference implementation of flag_vague_bullets that searches every
+    pattern against every bullet; kept for benchmarks.
     """
     flagged = []
     for line in resume_text.splitlines():
@@ -1,5 +1,8 @@
+import hashlib
 import re
 import random
+from collections import namedtuple
+from worker_pool import pool_map
 
 # Precompiled regex patterns for efficiency
 METRICS_PATTERN = re.compile(r"\b\d+[\d,.%+]*\b")
@@ -17,6 +20,25 @@ STAR_VERBS = [
 # File: resume_star_enhancer.py
 # Renamed from resume_rewriter to clarify STAR enhancement focus
 
+# With default workers, enhance_many runs in-process below this many job descriptions
+PARALLEL_MIN_JOBS = 500
+
+# Per-process parsed resume and seed used by enhance_many workers
+_worker_resume = None
+_worker_seed = None
+
+
+def _init_enhance_worker(parsed_resume, seed):
+    # The resume is parsed once in the parent and shipped to each worker once
+    global _worker_resume, _worker_seed
+    _worker_resume = parsed_resume
+    _worker_seed = seed
+
+
+def _enhance_in_worker(job_desc):
+    return _worker_resume.enhance(job_desc, _worker_seed)
+
+
 def extract_metrics(bullet: str) -> str:
     """Return comma-separated numeric metrics."""
     return ', '.join(METRICS_PATTERN.findall(bullet))
@@ -27,19 +49,15 @@ def extract_keywords(text: str) -> set:
     return {tok.lower() for tok in KEYWORD_PATTERN.findall(text)}
 
 
-def format_star_bullet(bullet: str, jd_keywords: set) -> str:
+# Parts of a bullet that do not depend on the job description
+ParsedBullet = namedtuple('ParsedBullet', 'text keywords situation action_phrase result')
+
+
+def parse_bullet(bullet: str) -> ParsedBullet:
     """
-    Convert a single bullet into STAR format with:
-      - Preceding 'Situation/Task', 'Action', 'Result' labels
-      - Active STAR verb
-      - Preserved metrics
-      - Highlighted overlapping keywords
+    Split a bullet into its STAR parts and keyword set once.
     """
     metrics = extract_metrics(bullet)
-    bullet_kw = extract_keywords(bullet)
-    highlights = bullet_kw & jd_keywords
-    highlight_str = f" Highlights: {', '.join(highlights)}" if highlights else ''
-
     parts = [p.strip() for p in SPLIT_PATTERN.split(bullet) if p.strip()]
     situation = parts[0] if parts else ''
     result = parts[-1] if len(parts) > 1 else metrics
@@ -47,33 +65,124 @@ def format_star_bullet(bullet: str, jd_keywords: set) -> str:
     # Extract action phrase
     match = VERB_PATTERN.match(situation)
     action_phrase = match.group(0) if match else situation
+    return ParsedBullet(bullet, frozenset(extract_keywords(bullet)), situation,
+                        action_phrase, result)
+
 
-    verb = random.choice(STAR_VERBS)
+def star_verb(bullet: str, seed=None) -> str:
+    """
+    Pick a STAR verb: random when seed is None, otherwise chosen from a
+    stable hash of (seed, bullet) so the same input always gets the same verb.
+    """
+    if seed is None:
+        return random.choice(STAR_VERBS)
+    digest = hashlib.sha1(f'{seed}\0{bullet}'.encode('utf-8')).digest()
+    return STAR_VERBS[int.from_bytes(digest[:8], 'big') % len(STAR_VERBS)]
+
+
+def _render(parsed: ParsedBullet, highlights, verb: str) -> str:
+    highlight_str = f" Highlights: {', '.join(highlights)}" if highlights else ''
     return (
-        f"Situation/Task: {situation}. "
-        f"Action: {verb} by {action_phrase}. "
-        f"Result: {result}.{highlight_str}"
+        f"Situation/Task: {parsed.situation}. "
+        f"Action: {verb} by {parsed.action_phrase}. "
+        f"Result: {parsed.result}.{highlight_str}"
     )
 
 
-def enhance_with_star(resume: str, job_desc: str) -> str:
+def format_star_bullet(bullet: str, jd_keywords: set, seed=None) -> str:
+    """
+    Convert a single bullet into STAR format with:
+      - Preceding 'Situation/Task', 'Action', 'Result' labels
+      - Active STAR verb
+      - Preserved metrics
+      - Highlighted overlapping keywords
+    With a seed the output is deterministic: the verb comes from star_verb
+    and highlights are sorted.
+    """
+    parsed = parse_bullet(bullet)
+    highlights = parsed.keywords & jd_keywords
+    if seed is not None:
+        highlights = sorted(highlights)
+    return _render(parsed, highlights, star_verb(bullet, seed))
+
+
+class ParsedResume:
+    """
+    Resume bullets parsed once for enhancement against many job descriptions.
+
+    Metrics, keyword sets and STAR parts are computed up front, so each
+    enhance() call only intersects bullet keywords with the JD keywords.
+    In seeded mode formatted bullets are memoized on
+    (bullet, highlighted keywords).
+    """
+
+    # Memoized bullets kept before the memo is reset
+    MEMO_MAXSIZE = 4096
+
+    def __init__(self, resume: str):
+        self.text = resume
+        self.bullets = []
+        for line in resume.splitlines():
+            stripped = line.strip()
+            if not stripped.startswith('-'):
+                continue
+            self.bullets.append(parse_bullet(stripped.lstrip('-').strip()))
+        self._formatted = {}
+
+    def format_bullet(self, parsed: ParsedBullet, jd_keywords: set, seed=None) -> str:
+        highlights = parsed.keywords & jd_keywords
+        if seed is None:
+            return _render(parsed, highlights, star_verb(parsed.text))
+        key = (seed, parsed.text, highlights)
+        star = self._formatted.get(key)
+        if star is None:
+            star = _render(parsed, sorted(highlights), star_verb(parsed.text, seed))
+            if len(self._formatted) >= self.MEMO_MAXSIZE:
+                self._formatted.clear()
+            self._formatted[key] = star
+        return star
+
+    def enhance(self, job_desc: str, seed=None) -> str:
+        """
+        STAR-format every bullet against job_desc (see enhance_with_star).
+        """
+        jd_keywords = extract_keywords(job_desc)
+        return '\n'.join(f"- {self.format_bullet(b, jd_keywords, seed)}" for b in self.bullets)
+
+
+def enhance_with_star(resume, job_desc: str, seed=None) -> str:
     """
     Enhance resume bullets using STAR format:
       - Preserve numeric facts
       - Improve verbs
       - Highlight job-specific skills
       - Maintain human-like style
+    resume may be text or a ParsedResume to reuse across job descriptions.
+    Pass a seed for deterministic output.
     """
-    jd_keywords = extract_keywords(job_desc)
-    enhanced = []
-    for line in resume.splitlines():
-        stripped = line.strip()
-        if not stripped.startswith('-'):
-            continue
-        bullet = stripped.lstrip('-').strip()
-        star = format_star_bullet(bullet, jd_keywords)
-        enhanced.append(f"- {star}")
-    return '\n'.join(enhanced)
+    if not isinstance(resume, ParsedResume):
+        resume = ParsedResume(resume)
+    return resume.enhance(job_desc, seed)
+
+
+def enhance_many(resume, job_descs, seed=None, workers=None, chunksize=None) -> list:
+    """
+    Enhance one resume against many job descriptions, returning results in
+    input order.
+
+    The resume is parsed once (or pass a ParsedResume) and shared with a
+    process pool of `workers` (default: CPU count) through the pool
+    initializer. workers=1 runs in-process, and so do small batches
+    (< PARALLEL_MIN_JOBS) unless workers is given explicitly, since a parsed
+    resume costs well under a millisecond per job.
+    """
+    if not isinstance(resume, ParsedResume):
+        resume = ParsedResume(resume)
+    # An explicit worker count is honoured; the threshold only guards the default
+    min_items = PARALLEL_MIN_JOBS if workers is None else 0
+    return pool_map(_enhance_in_worker, job_descs, workers, min_items=min_items,
+                    chunksize=chunksize, max_chunksize=100, initializer=_init_enhance_worker,
+                    initargs=(resume, seed), local=lambda jd: resume.enhance(jd, seed))
 
 # Example usage
 if __name__ == '__main__':
@@ -83,3 +192,7 @@ if __name__ == '__main__':
 '''
     jd = "Seeking a proactive Python engineer skilled in data labeling and accuracy optimization."
     print(enhance_with_star(sample, jd))
+
+    # Parse once, enhance deterministically for several job descriptions
+    parsed = ParsedResume(sample)
+    print(parsed.enhance(jd, seed=42) == parsed.enhance(jd, seed=42))  # True
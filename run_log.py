@@ -0,0 +1,82 @@
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+
+class RunTimer:
+    """
+    Per-stage wall time, CPU time and item counts for one pipeline run.
+
+    CPU time is time.thread_time() of the calling thread, so work done in
+    worker processes (categorize_many, enhance_many) shows up as wall time
+    only.
+    """
+
+    def __init__(self):
+        self.run_id = uuid.uuid4().hex
+        self.started = time.time()
+        self._wall0 = time.perf_counter()
+        self._cpu0 = time.thread_time()
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name: str, items=None, **fields):
+        """
+        Time the enclosed block as stage `name`. Yields the stage record so
+        the block can set record['items'] once the count is known; extra
+        fields (e.g. user=...) are stored on the record.
+        """
+        record = {'stage': name, 'items': items, **fields}
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield record
+        finally:
+            record['wall_s'] = round(time.perf_counter() - wall, 6)
+            record['cpu_s'] = round(time.thread_time() - cpu, 6)
+            self.stages.append(record)
+
+    def summary(self, status: str = 'ok', **extra) -> dict:
+        """
+        JSON-friendly record of the run so far.
+        """
+        return {
+            'run_id': self.run_id,
+            'started': self.started,
+            'status': status,
+            'wall_s': round(time.perf_counter() - self._wall0, 6),
+            'cpu_s': round(time.thread_time() - self._cpu0, 6),
+            'stages': list(self.stages),
+            **extra,
+        }
+
+
+class RunLog:
+    """
+    Append-only JSONL file of RunTimer summaries, one line per run.
+    """
+
+    def __init__(self, path: str = 'agent_runs.jsonl'):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, record: dict):
+        line = json.dumps(record) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+    def read(self) -> list:
+        """
+        Return all logged runs, oldest first.
+        """
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
@@ -0,0 +1,100 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from job_scraper import JobScraper
+
+
+class _BoardHandler(BaseHTTPRequestHandler):
+    # GET /<name>?delay=<seconds> returns two jobs titled after the board
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        stats = self.server.stats
+        with stats['lock']:
+            stats['active'] += 1
+            stats['max_active'] = max(stats['max_active'], stats['active'])
+        try:
+            url = urlparse(self.path)
+            time.sleep(float(parse_qs(url.query).get('delay', ['0'])[0]))
+            name = url.path.strip('/')
+            body = json.dumps([{'title': f'{name} {i}'} for i in range(2)]).encode('utf-8')
+        finally:
+            with stats['lock']:
+                stats['active'] -= 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def board_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _BoardHandler)
+    server.daemon_threads = True
+    server.stats = {'lock': threading.Lock(), 'active': 0, 'max_active': 0}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _site(server, name, delay, host='127.0.0.1'):
+    return {'name': name, 'url': f'http://{host}:{server.server_address[1]}/{name}',
+            'method': 'api', 'params': {'delay': delay}, 'fields': {'title': ['title']}}
+
+
+def test_concurrent_scrape_keeps_site_config_order(board_server):
+    configs = [_site(board_server, 'slow', 0.3), _site(board_server, 'fast', 0.0),
+               _site(board_server, 'medium', 0.1)]
+    with JobScraper(configs, per_host_limit=3) as scraper:
+        jobs = scraper.scrape_all(concurrent=True)
+    assert [job['title'] for job in jobs] == ['slow 0', 'slow 1', 'fast 0', 'fast 1',
+                                              'medium 0', 'medium 1']
+    assert [job['source'] for job in jobs[::2]] == ['slow', 'fast', 'medium']
+
+
+def test_concurrent_scrape_wall_time_tracks_slowest_site(board_server):
+    delay = 0.4
+    configs = [_site(board_server, f'board{i}', delay) for i in range(3)]
+    with JobScraper(configs, per_host_limit=3) as scraper:
+        start = time.perf_counter()
+        jobs = scraper.scrape_all(concurrent=True)
+        elapsed = time.perf_counter() - start
+    assert len(jobs) == 6
+    # Serial scraping would take 3 * delay
+    assert delay <= elapsed < 2 * delay
+
+
+def test_per_host_limit_serialises_requests_to_one_host(board_server):
+    delay = 0.2
+    configs = [_site(board_server, f'board{i}', delay) for i in range(3)]
+    with JobScraper(configs, per_host_limit=1) as scraper:
+        start = time.perf_counter()
+        jobs = scraper.scrape_all(concurrent=True)
+        elapsed = time.perf_counter() - start
+    assert len(jobs) == 6
+    assert board_server.stats['max_active'] == 1
+    assert elapsed >= 3 * delay
+
+
+def test_per_host_limit_is_per_host(board_server):
+    # 127.0.0.1 and localhost are different hosts to the scraper
+    delay = 0.3
+    configs = [_site(board_server, 'a', delay), _site(board_server, 'b', delay, host='localhost')]
+    with JobScraper(configs, per_host_limit=1) as scraper:
+        start = time.perf_counter()
+        jobs = scraper.scrape_all(concurrent=True)
+        elapsed = time.perf_counter() - start
+    assert len(jobs) == 4
+    assert board_server.stats['max_active'] == 2
+    assert elapsed < 2 * delay
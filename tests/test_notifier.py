@@ -0,0 +1,161 @@
+import json
+import socket
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from notifier import NotificationDispatcher
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    # Just enough SMTP for smtplib.sendmail; records connections and messages
+    def handle(self):
+        self.server.connections += 1
+        self._reply('220 stub')
+        data = None
+        for raw in self.rfile:
+            line = raw.decode('utf-8').rstrip('\r\n')
+            if data is not None:
+                if line == '.':
+                    self.server.messages.append('\n'.join(data))
+                    data = None
+                    self._reply('250 ok')
+                else:
+                    data.append(line)
+                continue
+            command = line[:4].upper()
+            if command in ('EHLO', 'HELO'):
+                self._reply('250 stub')
+            elif command == 'DATA':
+                data = []
+                self._reply('354 go ahead')
+            elif command == 'QUIT':
+                self._reply('221 bye')
+                return
+            else:
+                self._reply('250 ok')
+
+    def _reply(self, line):
+        self.wfile.write((line + '\r\n').encode('utf-8'))
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    # Answers the first server.failures POSTs with 500, then 200
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.attempts += 1
+        if self.server.failures:
+            self.server.failures -= 1
+            status = 500
+        else:
+            self.server.posts.append(json.loads(body))
+            status = 200
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve(server):
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def smtp_server():
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), _SMTPHandler)
+    server.connections = 0
+    server.messages = []
+    yield _serve(server)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def webhook():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _WebhookHandler)
+    server.failures = 0
+    server.attempts = 0
+    server.posts = []
+    yield _serve(server)
+    server.shutdown()
+    server.server_close()
+
+
+def _email_cfg(port, **extra):
+    return {'smtp_server': '127.0.0.1', 'smtp_port': port, 'starttls': False,
+            'from_addr': 'agent@example.com', 'to_addrs': ['user@example.com'], **extra}
+
+
+def _slack_cfg(server):
+    return {'url': f'http://127.0.0.1:{server.server_address[1]}/hook'}
+
+
+def _unused_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def test_batch_of_emails_shares_one_smtp_connection(smtp_server):
+    cfg = _email_cfg(smtp_server.server_address[1])
+    with NotificationDispatcher(backoff=0.01) as dispatcher:
+        for i in range(20):
+            dispatcher.send_email(cfg, f'Subject: match {i}\n\nbody {i}')
+        dispatcher.flush()
+        assert dispatcher.sent == 20
+        assert dispatcher.failed == 0
+    assert len(smtp_server.messages) == 20
+    assert smtp_server.connections == 1
+
+
+def test_slack_post_is_retried_after_server_error(webhook):
+    webhook.failures = 2
+    with NotificationDispatcher(max_retries=3, backoff=0.01) as dispatcher:
+        dispatcher.send_slack(_slack_cfg(webhook), {'text': 'hello'})
+        dispatcher.flush()
+        assert (dispatcher.sent, dispatcher.failed) == (1, 0)
+    assert webhook.attempts == 3
+    assert webhook.posts == [{'text': 'hello'}]
+
+
+def test_gives_up_after_max_retries(webhook):
+    webhook.failures = 10
+    with NotificationDispatcher(max_retries=3, backoff=0.01, timeout=2) as dispatcher:
+        dispatcher.send_slack(_slack_cfg(webhook), {'text': 'hello'})
+        dispatcher.send_email(_email_cfg(_unused_port()), 'Subject: lost\n\nbody')
+        dispatcher.flush()
+        assert (dispatcher.sent, dispatcher.failed) == (0, 2)
+    assert webhook.attempts == 3
+    assert webhook.posts == []
+
+
+def test_close_delivers_queued_mail(smtp_server):
+    cfg = _email_cfg(smtp_server.server_address[1])
+    dispatcher = NotificationDispatcher()
+    for i in range(5):
+        dispatcher.send_email(cfg, f'Subject: match {i}\n\nbody {i}')
+    dispatcher.close()
+    assert not dispatcher._thread.is_alive()
+    assert dispatcher.sent == 5
+    assert len(smtp_server.messages) == 5
+
+
+def test_bad_email_settings_do_not_stop_the_worker(smtp_server):
+    with NotificationDispatcher(max_retries=1) as dispatcher:
+        with pytest.raises(ValueError, match='smtp_server'):
+            dispatcher.send_email({'from_addr': 'a@example.com', 'to_addrs': ['b']}, 'x')
+        # Settings that get past send_email but cannot be delivered
+        dispatcher._queue.put(('email', {'smtp_port': [25]}, 'x'))
+        dispatcher.send_email(_email_cfg(smtp_server.server_address[1]), 'Subject: ok\n\nbody')
+        dispatcher.flush()
+        assert (dispatcher.sent, dispatcher.failed) == (1, 1)
+        assert dispatcher._thread.is_alive()
+    assert len(smtp_server.messages) == 1
@@ -0,0 +1,59 @@
+import os
+from itertools import chain, islice
+
+# Shared process-pool plumbing for the *_many batch APIs. Work is mapped
+# over a ProcessPoolExecutor with per-worker state set up once by an
+# initializer; inputs too small to repay pool startup run in-process.
+
+
+def resolve_workers(workers=None) -> int:
+    """
+    Worker count to use: workers, else the CPU count.
+    """
+    return workers or os.cpu_count() or 1
+
+
+def pool_map(fn, items, workers=None, min_items=0, chunksize=None, max_chunksize=1000,
+             initializer=None, initargs=(), local=None) -> list:
+    """
+    Map fn over items on a process pool, returning results in input order.
+
+    With one worker, or fewer than min_items items, local (default: fn)
+    runs in-process instead. Callers set min_items to the batch size below
+    which starting the pool and shipping the initializer state to every
+    worker costs more than the parallel work saves. The default chunksize
+    gives each worker about four chunks, capped at max_chunksize.
+    """
+    items = list(items)
+    workers = resolve_workers(workers)
+    if workers <= 1 or len(items) < min_items:
+        return list(map(local or fn, items))
+    if chunksize is None:
+        chunksize = max(1, min(len(items) // (workers * 4), max_chunksize))
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer,
+                             initargs=initargs) as pool:
+        return list(pool.map(fn, items, chunksize=chunksize))
+
+
+def pool_imap(fn, items, workers=None, chunksize=16, initializer=None, initargs=(),
+              local=None):
+    """
+    Streaming pool_map: yields results in input order while consuming items
+    in windows of four chunks per worker, so memory stays bounded. Input
+    smaller than one window runs in-process with local (default: fn).
+    """
+    workers = resolve_workers(workers)
+    items = iter(items)
+    window = workers * chunksize * 4
+    batch = list(islice(items, window))
+    if workers <= 1 or len(batch) < window:
+        yield from map(local or fn, chain(batch, items))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer,
+                             initargs=initargs) as pool:
+        while batch:
+            yield from pool.map(fn, batch, chunksize=chunksize)
+            batch = list(islice(items, window))